@@ -5,10 +5,18 @@ Configures VCR for cassette recording/replay, logging, and shared fixtures.
 Also imports git repository test fixtures.
 """
 
-import pytest
-import vcr
+import functools
 import os
+
+import pytest
+from tests.constants import (
+    TP_TEST_FEATURE_ID,
+    TP_TEST_OBJECTIVE_ID,
+    TP_TEST_RELEASE_ID,
+    TP_TEST_TEAM_ID,
+)
 from tests.fixtures.git_helper import (
+    git_repo_template,
     git_repo,
     git_repo_with_branches,
     git_repo_tracking_scenario,
@@ -22,35 +30,52 @@ pytest_plugins = [
 ]
 
 
-# Configure VCR for golden file cassette recording/replay
-vcr_config = vcr.VCR(
-    # Record mode: 'once' = record if cassette doesn't exist, else replay
-    # Use 'new_episodes' to add new interactions to existing cassettes
-    record_mode=os.environ.get("VCR_RECORD_MODE", "once"),
+# Configure VCR for golden file cassette recording/replay.
+# vcrpy is imported on first use only, so runs without VCR tests skip its
+# import and config setup.
+CASSETTE_LIBRARY_DIR = "tests/fixtures/python"
 
-    # Cassette directory
-    cassette_library_dir="tests/fixtures/python",
 
-    # Filter sensitive headers and query params
-    filter_headers=[
-        "Authorization",
-        "access-token",
-        "x-api-key",
-    ],
+@functools.lru_cache(maxsize=1)
+def get_vcr_config():
+    """Build the shared VCR configuration (once per session)."""
+    import vcr
+    from tests.fixtures.vcr_cache import CachedFilesystemPersister, prefetch_cassettes
 
-    # Remove API tokens from URIs before recording
-    filter_query_parameters=["access_token", "token"],
+    vcr_config = vcr.VCR(
+        # Record mode: 'once' = record if cassette doesn't exist, else replay
+        # Use 'new_episodes' to add new interactions to existing cassettes
+        record_mode=os.environ.get("VCR_RECORD_MODE", "once"),
 
-    # Match requests by method and URI (ignore body/headers variations)
-    match_on=["method", "uri"],
+        # Cassette directory
+        cassette_library_dir=CASSETTE_LIBRARY_DIR,
 
-    # Path transformer: extract just the path, not full URI
-    # This makes cassettes more portable
-    path_transformer=vcr.VCR.ensure_suffix(".yaml"),
+        # Filter sensitive headers and query params
+        filter_headers=[
+            "Authorization",
+            "access-token",
+            "x-api-key",
+        ],
 
-    # Don't record requests that match these patterns
-    ignore_hosts=["localhost", "127.0.0.1"],
-)
+        # Remove API tokens from URIs before recording
+        filter_query_parameters=["access_token", "token"],
+
+        # Match requests by method and URI (ignore body/headers variations)
+        match_on=["method", "uri"],
+
+        # Path transformer: extract just the path, not full URI
+        # This makes cassettes more portable
+        path_transformer=vcr.VCR.ensure_suffix(".yaml"),
+
+        # Don't record requests that match these patterns
+        ignore_hosts=["localhost", "127.0.0.1"],
+    )
+
+    # Read all cassettes up front and serve them from memory
+    prefetch_cassettes(CASSETTE_LIBRARY_DIR)
+    vcr_config.register_persister(CachedFilesystemPersister)
+
+    return vcr_config
 
 
 @pytest.fixture
@@ -64,7 +89,21 @@ def vcr_config_fixture():
             # Cassette is auto-loaded from tests/fixtures/python/
             ...
     """
-    return vcr_config
+    return get_vcr_config()
+
+
+def pytest_report_header(config):
+    """
+    pytest hook: Report which YAML backend VCR cassettes are parsed with.
+
+    vcrpy uses libyaml's C loader/dumper when PyYAML was built with it and
+    silently falls back to the much slower pure-Python implementation.
+    """
+    import yaml
+
+    if yaml.__with_libyaml__:
+        return "cassette yaml: libyaml (C loader/dumper)"
+    return "cassette yaml: pure Python (install PyYAML with libyaml for faster cassettes)"
 
 
 def pytest_configure(config):
@@ -93,25 +132,25 @@ def tp_api_token():
     return os.environ.get("TP_TOKEN", "test-token")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tp_test_team_id():
     """Fixture providing test team ID."""
-    return 1935991
+    return TP_TEST_TEAM_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tp_test_release_id():
     """Fixture providing test release ID."""
-    return 1942235
+    return TP_TEST_RELEASE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tp_test_objective_id():
     """Fixture providing test objective ID."""
-    return 12345
+    return TP_TEST_OBJECTIVE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tp_test_feature_id():
     """Fixture providing test feature ID."""
-    return 5678
+    return TP_TEST_FEATURE_ID
@@ -0,0 +1,11 @@
+"""
+Shared test constants.
+
+Well-known TargetProcess IDs used across tests. Import these directly where
+a fixture is not needed; the tp_test_* fixtures in conftest.py return them.
+"""
+
+TP_TEST_TEAM_ID = 1935991
+TP_TEST_RELEASE_ID = 1942235
+TP_TEST_OBJECTIVE_ID = 12345
+TP_TEST_FEATURE_ID = 5678
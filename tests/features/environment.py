@@ -0,0 +1,94 @@
+"""
+Behave environment hooks.
+
+Caches step-definition matching across the run, provides one template git
+repository (built on first use) that scenario repositories are copied from,
+checks once whether the suite runs inside a git work tree, preallocates each
+scenario's step state and fixture containers, invalidates cached repository
+state before Given/When steps, and releases per-scenario resources (temporary
+git repositories and their long-running git processes) once each scenario
+finishes.
+"""
+
+import functools
+import subprocess
+
+from behave.matchers import ParseMatcher, RegexMatcher
+
+from tests.features.state import new_scenario_state
+from tests.fixtures.git_helper import LazyTemplateRepo
+
+
+def _cache_check_match(matcher_class):
+    """
+    Memoize matcher_class.check_match per step definition, keyed by step text.
+
+    Behave tries every step definition against every step it runs, so the same
+    (pattern, step text) pairs are parsed over and over. Results (including
+    typed parameters such as {n:d}) are cached; conversion errors are not.
+    """
+    check_match = matcher_class.check_match
+
+    @functools.wraps(check_match)
+    def cached_check_match(self, step_text):
+        cache = self.__dict__.setdefault("_check_match_cache", {})
+        try:
+            return cache[step_text]
+        except KeyError:
+            matched_args = cache[step_text] = check_match(self, step_text)
+            return matched_args
+
+    matcher_class.check_match = cached_check_match
+
+
+_cache_check_match(ParseMatcher)
+_cache_check_match(RegexMatcher)
+
+
+def before_all(context):
+    """Set up the lazy template repo and check whether git is available."""
+    context.git_repo_template = LazyTemplateRepo()
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--is-inside-work-tree"], capture_output=True
+        )
+    except OSError:
+        # No git executable at all (FileNotFoundError is an OSError)
+        git_available = False
+    else:
+        git_available = result.returncode == 0
+    context.config.userdata["git_available"] = git_available
+
+
+def after_all(context):
+    """Remove the template repo, if any scenario created it."""
+    context.git_repo_template.cleanup()
+
+
+def before_scenario(context, scenario):
+    """Give each scenario a fresh step state dict and fixture containers."""
+    context.state = new_scenario_state()
+    # Filled by markdown generation Given/Then steps
+    context.program_objectives = []
+    context.team_objectives = []
+    context.team_objectives_by_id = {}
+    context.h2_sections = []
+    context.h3_sections = []
+    context.objective_sections = []
+    context.frontmatter_fields = {}
+    context.frontmatter_timestamps = []
+
+
+def before_step(context, step):
+    """Drop cached repo state before any step that may change the repo."""
+    status_cache = getattr(context, "status_cache", None)
+    if status_cache and step.step_type != "then":
+        status_cache.clear()
+
+
+def after_scenario(context, scenario):
+    """Clean up the scenario's GitTestRepo, if one was created."""
+    repo = getattr(context, "git_repo", None)
+    if repo is not None:
+        repo.cleanup()
+        context.git_repo = None
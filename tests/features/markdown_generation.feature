@@ -9,11 +9,15 @@ Feature: Markdown Generation from TargetProcess Data
     And Release "PI-4/25" exists for the ART
     And Program Objective "Data Quality Improvements" exists for release
     And Program Objective "Security Hardening" exists for release
-    And Team Objective "Platform governance" (ID=2019099) exists with status="Pending" effort=21 owner="Norbert Borský"
-    And Team Objective "Supporting the DQ initiative" (ID=2027963) exists with status="In Progress" effort=34 owner="Sarah Chen"
-    And Feature "Governance Framework Definition" (ID=1001) linked to objective 2019099 with effort=8 owner="John Smith"
-    And Feature "Process Documentation" (ID=1002) linked to objective 2019099 with effort=8 owner="Jane Doe"
-    And Feature "Training and Enablement" (ID=1003) linked to objective 2019099 with effort=5
+    And the following team objectives exist:
+      | id      | name                         | status      | effort | owner          |
+      | 2019099 | Platform governance          | Pending     | 21     | Norbert Borský |
+      | 2027963 | Supporting the DQ initiative | In Progress | 34     | Sarah Chen     |
+    And the following features are linked to team objectives:
+      | id   | name                            | objective | effort | owner      |
+      | 1001 | Governance Framework Definition | 2019099   | 8      | John Smith |
+      | 1002 | Process Documentation           | 2019099   | 8      | Jane Doe   |
+      | 1003 | Training and Enablement         | 2019099   | 5      |            |
 
   Scenario: Generate markdown with team objectives and epics
     When markdown generator exports objectives for team="Platform Eco" release="PI-4/25"
@@ -0,0 +1,138 @@
+"""
+Per-scenario step state for behave.
+
+Steps record what happened in one preallocated dict, context.state, instead
+of setting a new context attribute per flag. Behave routes every context
+attribute write through its layered scope machinery; a dict whose keys are
+all known up front is a plain store.
+
+Values other steps need to read (tracking_branch, feature_branch, the
+scenario's GitTestRepo) stay on context.
+
+Flag names are interned, and steps only use them as bare identifier-shaped
+literals (never f-strings), so state lookups hit the interned-key fast path.
+
+register_flag_steps() defines the steps whose only effect is recording that
+they ran, for whichever store (context.state or context) a module uses.
+
+api_client() hands every scenario the same TPAPIClient (construction reads
+the config file), with its cache cleared the first time a scenario asks.
+"""
+
+import functools
+import sys
+
+from behave import given, when, then
+
+from tpcli_pi.core.api_client import TPAPIClient
+
+_STEP_DECORATORS = {"given": given, "when": when, "then": then}
+
+# Boolean flags set by git integration steps
+GIT_FLAG_NAMES = tuple(sys.intern(name) for name in (
+    "all_synced",
+    "api_fetch_called",
+    "api_matches",
+    "changes_committed",
+    "conflict_expected",
+    "feature_branch_current",
+    "feature_rebased",
+    "feature_updated",
+    "file_edited",
+    "file_staged",
+    "history_complete",
+    "init_complete",
+    "markdown_committed",
+    "markdown_exported",
+    "markers_removed",
+    "message_preserved",
+    "more_commits_done",
+    "pi4_safe",
+    "pull_again_done",
+    "pull_from_tp_complete",
+    "pull_no_conflict_done",
+    "push_again_done",
+    "push_to_tp_complete",
+    "rebase_complete",
+    "rebase_continue",
+    "rebase_continue_success",
+    "rebase_paused",
+    "rebase_success",
+    "switch_ok",
+    "tracking_branch_current",
+    "tracking_branch_exists",
+    "tracking_per_release",
+    "tracking_updated",
+    "working_tree_clean",
+))
+
+# Boolean flags set by python API steps
+API_FLAG_NAMES = tuple(sys.intern(name) for name in (
+    "cache_updated",
+    "correct_type_returned",
+    "error_raised",
+    "external_update_possible",
+    "feature_cache_updated",
+    "field_preserved",
+    "field_updated",
+    "first_call_verified",
+    "no_optional_fields",
+    "objective_in_cache",
+    "other_fields_excluded",
+    "others_excluded",
+    "payload_minimal",
+    "response_parsed",
+    "second_call_verified",
+    "subprocess_will_fail",
+    "subsequent_get_returns_updated",
+    "subsequent_get_returns_updated_objective",
+    "tp_api_available",
+    "update_feature_tpcli_called",
+    "updated_feature_returned",
+    "updated_objective_returned",
+))
+
+
+def new_scenario_state():
+    """Build a fresh state dict: all flags False, empty step payloads."""
+    state = dict.fromkeys(GIT_FLAG_NAMES + API_FLAG_NAMES, False)
+    state["payload"] = {}
+    return state
+
+
+def register_flag_steps(steps, record_flag):
+    """
+    Register steps that only record a flag when they run.
+
+    Args:
+        steps: (kind, pattern, flag name) tuples; kind is "given", "when" or "then"
+        record_flag: Callable (context, flag name) that stores the flag as True
+    """
+    for kind, pattern, flag_name in steps:
+        _STEP_DECORATORS[kind](pattern)(_flag_step(record_flag, sys.intern(flag_name)))
+
+
+def record_state_flag(context, flag_name):
+    """Store flag_name as True in context.state."""
+    context.state[flag_name] = True
+
+
+def _flag_step(record_flag, flag_name):
+    """Build a step that only records flag_name."""
+    def step_impl(context, **kwargs):
+        record_flag(context, flag_name)
+    return step_impl
+
+
+@functools.cache
+def _shared_api_client():
+    return TPAPIClient()
+
+
+def api_client(context):
+    """This scenario's TPAPIClient (also stored as context.client)."""
+    if not hasattr(context, "client"):
+        client = _shared_api_client()
+        client.clear_cache()
+        context.client = client
+    return context.client
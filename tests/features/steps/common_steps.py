@@ -4,18 +4,28 @@ Shared BDD step definitions used across multiple feature files.
 Includes error message handling and other common verification steps.
 """
 
+import functools
+import re
+
 from behave import then
 
 
+@functools.lru_cache(maxsize=256)
+def _expected_text_pattern(expected_text):
+    """Compile '"text1" or "text2"' alternatives into one case-insensitive regex."""
+    texts = [t.strip() for t in expected_text.split(' or ')]
+    return texts, re.compile("|".join(re.escape(t) for t in texts), re.IGNORECASE)
+
+
 @then("error message contains \"{expected_text}\"")
 def step_error_message_contains(context, expected_text):
     """Verify error message contains expected text (single or alternative separated by 'or')"""
     # Check stderr first, then stdout (some errors go to stdout)
     error_output = getattr(context, 'stderr', '') or getattr(context, 'stdout', '') or getattr(context, 'error_message', '')
 
-    # Handle "text1" or "text2" pattern
-    texts = [t.strip() for t in expected_text.split(' or ')]
-    found = any(text.lower() in error_output.lower() for text in texts)
+    # Handle "text1" or "text2" pattern in a single pass over the output
+    texts, pattern = _expected_text_pattern(expected_text)
+    found = pattern.search(error_output) is not None
 
     assert found, \
         f"Expected error to contain any of {texts}. Got: {error_output}"
@@ -7,18 +7,99 @@ and bidirectional sync between TargetProcess and git repository.
 Uses GitTestRepo fixture for actual git operations.
 """
 
+import re
+import shlex
 import subprocess
 from behave import given, when, then
-from tests.fixtures.git_helper import GitTestRepo
+from tests.features.state import record_state_flag, register_flag_steps
+from tests.fixtures.git_helper import FastImportCommit, GitTestRepo, plan_branch_names
 
+# Conflict marker lines (<<<<<<< / ======= / >>>>>>>) and blank lines
+_CONFLICT_RE = re.compile(r"^(?:<{7}|={7}|>{7}).*\n?|^\s*\n", re.MULTILINE)
 
 def get_or_create_repo(context):
     """Get or create a git test repo in the context."""
     if not hasattr(context, "git_repo") or context.git_repo is None:
-        context.git_repo = GitTestRepo()
+        context.git_repo = GitTestRepo(template=context.git_repo_template.repo_path)
+        context.md_cache = {}
+        context.status_cache = {}
     return context.git_repo
 
 
+def read_markdown(context, repo, filename, default=None):
+    """
+    Read a markdown file on the current branch via the scenario's buffer.
+
+    Content written by write_markdown (and committed) is served from memory
+    on later reads, including after checking the branch out again. Returns
+    default if the file does not exist and a default is given.
+    """
+    key = (repo.get_current_branch(), filename)
+    if key not in context.md_cache:
+        try:
+            context.md_cache[key] = repo.read_file(filename)
+        except FileNotFoundError:
+            if default is None:
+                raise
+            return default
+    return context.md_cache[key]
+
+
+def write_markdown(context, repo, filename, content):
+    """
+    Write a markdown file on the current branch and keep the buffer in sync.
+
+    Returns False without touching the disk if the buffer shows the file
+    already has this content, so callers can skip the (empty) commit.
+    """
+    key = (repo.get_current_branch(), filename)
+    if context.md_cache.get(key) == content:
+        return False
+    context.md_cache[key] = content
+    repo.write_file(filename, content)
+    return True
+
+
+def repo_status(context, repo):
+    """
+    Get `git status --short` for a Then step, shared across the Then block.
+
+    Then steps don't change the repository, so consecutive verifications
+    reuse one status call. The cache is cleared before every Given/When step
+    (see environment.before_step).
+    """
+    if "status" not in context.status_cache:
+        context.status_cache["status"] = repo.get_status()
+    return context.status_cache["status"]
+
+
+def repo_branches(context, repo):
+    """Get the branch list for a Then step, shared across the Then block."""
+    if "branches" not in context.status_cache:
+        context.status_cache["branches"] = repo.get_branch_list()
+    return context.status_cache["branches"]
+
+
+def _insert_field(content, obj_id, field, value):
+    """
+    Add "field: value" under the "## Objective <obj_id>" heading.
+
+    Only the first matching heading is changed. If the objective is not in
+    the markdown yet, a new section is appended.
+    """
+    needle = f"## Objective {obj_id}"
+    i = content.find(needle)
+    if i < 0:
+        return content + f"\n{needle}\n{field}: {value}\n"
+    j = i + len(needle)
+    return content[:j] + f"\n{field}: {value}" + content[j:]
+
+
+def invalidate_markdown(context):
+    """Drop buffered markdown after git rewrites files (rebase, merge)."""
+    context.md_cache.clear()
+
+
 # Setup: Create tracking branches and feature branches
 
 
@@ -40,14 +121,18 @@ def step_feature_branch_with_commits(context, branch_name):
     repo.checkout(branch_name)
 
     # Add some commits
-    repo.write_file("objectives.md", "# Objectives\n\nObjective 1\n")
-    repo.commit("Add Objective 1", "objectives.md")
-
-    repo.write_file("objectives.md", "# Objectives\n\nObjective 1\nObjective 2\n")
-    repo.commit("Add Objective 2", "objectives.md")
+    contents = [
+        ("Add Objective 1", "# Objectives\n\nObjective 1\n"),
+        ("Add Objective 2", "# Objectives\n\nObjective 1\nObjective 2\n"),
+    ]
+    repo.fast_import([
+        FastImportCommit(message, {"objectives.md": content})
+        for message, content in contents
+    ])
+    context.md_cache[(branch_name, "objectives.md")] = contents[-1][1]
 
     context.feature_branch = branch_name
-    context.local_commits = 2
+    context.state["payload"]["local_commits"] = 2
 
 
 @given("feature branch has {n:d} commits ahead of tracking branch")
@@ -55,14 +140,15 @@ def step_feature_commits_ahead(context, n):
     """Setup: Feature branch has N commits ahead."""
     repo = get_or_create_repo(context)
 
-    for i in range(n):
-        repo.write_file(
-            f"change-{i}.md",
-            f"# Change {i}\n\nLocal user change {i}\n"
+    repo.fast_import([
+        FastImportCommit(
+            f"User change {i}",
+            {f"change-{i}.md": f"# Change {i}\n\nLocal user change {i}\n"},
         )
-        repo.commit(f"User change {i}", f"change-{i}.md")
+        for i in range(n)
+    ])
 
-    context.commits_ahead = n
+    context.state["payload"]["commits_ahead"] = n
 
 
 @given("tracking branch markdown has \"{field}: {value}\" for objective {obj_id:d}")
@@ -70,20 +156,14 @@ def step_tracking_has_field(context, field, value, obj_id):
     """Setup: Tracking branch has specific field value."""
     repo = get_or_create_repo(context)
 
-    content = repo.read_file("objectives.md")
+    content = read_markdown(context, repo, "objectives.md")
     # Add field to the markdown
-    if f"## Objective {obj_id}" in content:
-        content = content.replace(
-            f"## Objective {obj_id}",
-            f"## Objective {obj_id}\n{field}: {value}"
-        )
-    else:
-        content += f"\n## Objective {obj_id}\n{field}: {value}\n"
+    content = _insert_field(content, obj_id, field, value)
 
-    repo.write_file("objectives.md", content)
-    repo.commit(f"Set {field}={value} for objective {obj_id}", "objectives.md")
+    if write_markdown(context, repo, "objectives.md", content):
+        repo.commit(f"Set {field}={value} for objective {obj_id}", "objectives.md")
 
-    context.tracking_value = {field: value, "obj_id": obj_id}
+    context.state["payload"]["tracking_value"] = {field: value, "obj_id": obj_id}
 
 
 @given("feature branch markdown has \"{field}: {value}\" for objective {obj_id:d}")
@@ -91,19 +171,13 @@ def step_feature_has_field(context, field, value, obj_id):
     """Setup: Feature branch has specific field value."""
     repo = get_or_create_repo(context)
 
-    content = repo.read_file("objectives.md") if (repo.repo_path / "objectives.md").exists() else ""
-    if f"## Objective {obj_id}" in content:
-        content = content.replace(
-            f"## Objective {obj_id}",
-            f"## Objective {obj_id}\n{field}: {value}"
-        )
-    else:
-        content += f"\n## Objective {obj_id}\n{field}: {value}\n"
+    content = read_markdown(context, repo, "objectives.md", default="")
+    content = _insert_field(content, obj_id, field, value)
 
-    repo.write_file("objectives.md", content)
-    repo.commit(f"Feature: set {field}={value}", "objectives.md")
+    if write_markdown(context, repo, "objectives.md", content):
+        repo.commit(f"Feature: set {field}={value}", "objectives.md")
 
-    context.feature_value = {field: value, "obj_id": obj_id}
+    context.state["payload"]["feature_value"] = {field: value, "obj_id": obj_id}
 
 
 # Operations: Init, pull, push
@@ -114,35 +188,28 @@ def step_init_plan_tracking(context, team, release):
     """Execute: Initialize plan tracking."""
     repo = get_or_create_repo(context)
 
-    # Create tracking branch
-    tracking_branch = f"TP-{release.replace('/', '-').upper()}-{team.lower().replace(' ', '-')}"
-    repo.create_branch(tracking_branch)
-    repo.checkout(tracking_branch)
-
-    # Create initial objectives file with descriptive name
-    # Filename should be: <release-normalized>-<team-normalized>.md
-    release_norm = release.lower().replace("/", "-")
-    team_norm = team.lower().replace(" ", "-")
-    filename = f"{release_norm}-{team_norm}.md"
-
-    repo.write_file(
-        filename,
-        f"# {team} - {release}\n\n## Objectives\n"
-    )
-    repo.commit(f"Initialize plan tracking for {team}/{release}", filename)
-
-    # Create feature branch from tracking
-    feature_branch = f"feature/plan-{release.lower().replace('/', '-')}"
-    repo.create_branch(feature_branch, tracking_branch)
-
-    # Check out feature branch for user to work on
-    repo.checkout(feature_branch)
-
-    context.team = team
-    context.release = release
+    # Tracking branch, feature branch (created from tracking) and initial
+    # objectives file named <release-normalized>-<team-normalized>.md
+    tracking_branch, feature_branch, filename = plan_branch_names(team, release)
+
+    # Run the whole sequence as one script, ending on the feature branch
+    # for the user to work on
+    commit_hash = repo.run_script([
+        shlex.join(["git", "checkout", "-q", "-b", tracking_branch]),
+        repo.write_file_cmd(filename, f"# {team} - {release}\n\n## Objectives\n"),
+        shlex.join(["git", "add", filename]),
+        shlex.join(["git", "commit", "-q", "-m", f"Initialize plan tracking for {team}/{release}"]),
+        shlex.join(["git", "checkout", "-q", "-b", feature_branch]),
+        "git rev-parse HEAD",
+    ])
+    repo.commits.setdefault(tracking_branch, []).append(commit_hash)
+    repo.current_branch = feature_branch
+
+    context.state["payload"]["team"] = team
+    context.state["payload"]["release"] = release
     context.tracking_branch = tracking_branch
     context.feature_branch = feature_branch
-    context.init_complete = True
+    context.state["init_complete"] = True
 
 
 @when("user pulls latest from TargetProcess for team=\"{team}\" release=\"{release}\"")
@@ -151,7 +218,7 @@ def step_pull_from_tp(context, team, release):
     repo = get_or_create_repo(context)
 
     # Simulate pulling fresh TP data by updating tracking branch
-    tracking_branch = getattr(context, "tracking_branch", f"TP-{release.replace('/', '-').upper()}-{team.lower().replace(' ', '-')}")
+    tracking_branch = getattr(context, "tracking_branch", None) or plan_branch_names(team, release)[0]
 
     # Store current branch
     current = repo.get_current_branch()
@@ -160,17 +227,17 @@ def step_pull_from_tp(context, team, release):
     repo.checkout(tracking_branch)
 
     # Update with fresh TP data (simulated)
-    content = repo.read_file("objectives.md")
+    content = read_markdown(context, repo, "objectives.md")
     content += "\n# Updated from TargetProcess\n"
-    repo.write_file("objectives.md", content)
-    repo.commit("TP sync: Pull fresh state", "objectives.md")
+    if write_markdown(context, repo, "objectives.md", content):
+        repo.commit("TP sync: Pull fresh state", "objectives.md")
 
     # Switch back to feature branch
     repo.checkout(current)
 
-    context.pull_from_tp_complete = True
-    context.tp_pull_team = team
-    context.tp_pull_release = release
+    context.state["pull_from_tp_complete"] = True
+    context.state["payload"]["tp_pull_team"] = team
+    context.state["payload"]["tp_pull_release"] = release
 
 
 @when("user pulls from TargetProcess which has \"{field}: {value}\" for objective {obj_id:d}")
@@ -186,28 +253,23 @@ def step_pull_with_tp_value(context, field, value, obj_id):
 
     # Update tracking branch with TP value
     repo.checkout(tracking_branch)
-    content = repo.read_file("objectives.md")
-    if f"## Objective {obj_id}" in content:
-        content = content.replace(
-            f"## Objective {obj_id}",
-            f"## Objective {obj_id}\n{field}: {value}"
-        )
-    else:
-        content += f"\n## Objective {obj_id}\n{field}: {value}\n"
+    content = read_markdown(context, repo, "objectives.md")
+    content = _insert_field(content, obj_id, field, value)
 
-    repo.write_file("objectives.md", content)
-    repo.commit(f"TP pull: {field}={value} for obj {obj_id}", "objectives.md")
+    if write_markdown(context, repo, "objectives.md", content):
+        repo.commit(f"TP pull: {field}={value} for obj {obj_id}", "objectives.md")
 
     # Try to rebase feature branch
     repo.checkout(feature_branch)
     try:
         # Try rebase - this might fail with conflicts
         repo._run_git("rebase", tracking_branch, check=False)
-        context.conflict_expected = False
+        invalidate_markdown(context)
+        context.state["conflict_expected"] = False
     except Exception:
-        context.conflict_expected = True
+        context.state["conflict_expected"] = True
 
-    context.tp_value = {field: value, "obj_id": obj_id}
+    context.state["payload"]["tp_value"] = {field: value, "obj_id": obj_id}
 
 
 @when("user commits changes to feature branch")
@@ -215,10 +277,10 @@ def step_commit_changes(context):
     """Execute: Commit changes on feature branch."""
     repo = get_or_create_repo(context)
 
-    repo.write_file("feature_change.md", "# User change\n")
-    repo.commit("User commits change", "feature_change.md")
+    if repo.write_file_if_changed("feature_change.md", "# User change\n"):
+        repo.commit("User commits change", "feature_change.md")
 
-    context.changes_committed = True
+    context.state["changes_committed"] = True
 
 
 @when("user pulls from TargetProcess (no conflicts)")
@@ -229,17 +291,30 @@ def step_pull_no_conflicts(context):
     tracking_branch = getattr(context, "tracking_branch", None)
     current = repo.get_current_branch()
 
-    if tracking_branch and current != tracking_branch:
-        # Update tracking with non-conflicting changes
-        repo.checkout(tracking_branch)
-        repo.write_file("tp_update.md", "# TP Update\n")
-        repo.commit("TP sync: non-conflicting update", "tp_update.md")
+    # Nothing to pull if tracking hasn't moved since feature was last rebased
+    # onto it (e.g. "pull again" straight after a pull)
+    last = getattr(context, "last_pull_sha", None)
+    up_to_date = (
+        tracking_branch is not None
+        and last is not None
+        and repo.resolve(tracking_branch) == last
+    )
 
-        # Rebase feature onto updated tracking
-        repo.checkout(current)
-        repo._run_git("rebase", tracking_branch)
+    if tracking_branch and current != tracking_branch and not up_to_date:
+        # Update tracking with non-conflicting changes, then rebase
+        # feature onto updated tracking
+        repo.run_script([
+            shlex.join(["git", "checkout", "-q", tracking_branch]),
+            repo.write_file_cmd("tp_update.md", "# TP Update\n"),
+            "git add tp_update.md",
+            "git commit -q -m 'TP sync: non-conflicting update'",
+            shlex.join(["git", "checkout", "-q", current]),
+            shlex.join(["git", "rebase", "-q", tracking_branch]),
+        ])
+        invalidate_markdown(context)
+        context.last_pull_sha = repo.resolve(tracking_branch)
 
-    context.pull_no_conflict_done = True
+    context.state["pull_no_conflict_done"] = True
 
 
 @when("user commits more changes")
@@ -247,17 +322,17 @@ def step_commit_more(context):
     """Execute: Commit more changes."""
     repo = get_or_create_repo(context)
 
-    repo.write_file("more_changes.md", "# More changes\n")
-    repo.commit("More user changes", "more_changes.md")
+    if repo.write_file_if_changed("more_changes.md", "# More changes\n"):
+        repo.commit("More user changes", "more_changes.md")
 
-    context.more_commits_done = True
+    context.state["more_commits_done"] = True
 
 
 @when("user pulls from TargetProcess again (no conflicts)")
 def step_pull_again(context):
     """Execute: Pull again (no conflicts)."""
     step_pull_no_conflicts(context)
-    context.pull_again_done = True
+    context.state["pull_again_done"] = True
 
 
 @when("user pushes to TargetProcess")
@@ -269,22 +344,24 @@ def step_push_to_tp(context):
     feature_branch = repo.get_current_branch()
 
     if tracking_branch:
-        # Calculate diff between tracking and feature
-        diff = repo.get_diff(tracking_branch, feature_branch)
-        context.push_diff = diff
-
-        # Simulate push by updating tracking branch
-        repo.checkout(tracking_branch)
-        repo._run_git("merge", "--no-ff", feature_branch)
+        # Calculate diff between tracking and feature, then simulate push
+        # by updating tracking branch
+        context.state["payload"]["push_diff"] = repo.run_script([
+            shlex.join(["git", "--no-pager", "diff", tracking_branch, feature_branch]),
+            shlex.join(["git", "checkout", "-q", tracking_branch]),
+            shlex.join(["git", "merge", "-q", "--no-ff", "--no-edit", feature_branch]),
+        ])
+        invalidate_markdown(context)
+        repo.current_branch = tracking_branch
 
-    context.push_to_tp_complete = True
+    context.state["push_to_tp_complete"] = True
 
 
 @when("user pushes to TargetProcess again")
 def step_push_again(context):
     """Execute: Push again."""
     step_push_to_tp(context)
-    context.push_again_done = True
+    context.state["push_again_done"] = True
 
 
 @when("user edits {filename} to resolve conflict")
@@ -293,15 +370,12 @@ def step_edit_file_resolve(context, filename):
     repo = get_or_create_repo(context)
 
     # Remove conflict markers and keep our version
-    content = repo.read_file(filename)
-    # Simple conflict resolution: just remove markers
-    content = content.replace("<<<<<<< HEAD", "")
-    content = content.replace("=======", "")
-    content = content.replace(">>>>>>> ", "")
-    content = "\n".join(line for line in content.split("\n") if line.strip())
+    content = read_markdown(context, repo, filename)
+    # Simple conflict resolution: just remove marker and blank lines
+    content = _CONFLICT_RE.sub("", content)
 
-    repo.write_file(filename, content)
-    context.file_edited = True
+    write_markdown(context, repo, filename, content)
+    context.state["file_edited"] = True
 
 
 @when("user removes conflict markers")
@@ -309,14 +383,12 @@ def step_remove_conflict_markers(context):
     """Execute: Remove conflict markers."""
     repo = get_or_create_repo(context)
 
-    # Find files with conflicts
-    status = repo.get_status()
-    for line in status.split("\n"):
-        if "UU" in line or "AA" in line:
-            filename = line.split()[-1]
-            step_edit_file_resolve(context, filename)
+    # Find files with conflicts (unmerged paths only)
+    unmerged = repo._run_git("diff", "--name-only", "--diff-filter=U")
+    for filename in unmerged.splitlines():
+        step_edit_file_resolve(context, filename)
 
-    context.markers_removed = True
+    context.state["markers_removed"] = True
 
 
 @when("user stages resolved file with git add")
@@ -324,7 +396,7 @@ def step_stage_resolved(context):
     """Execute: Stage resolved file."""
     repo = get_or_create_repo(context)
     repo.add_all()
-    context.file_staged = True
+    context.state["file_staged"] = True
 
 
 @when("user continues rebase with git rebase --continue")
@@ -334,11 +406,12 @@ def step_continue_rebase(context):
 
     try:
         repo._run_git("rebase", "--continue")
-        context.rebase_continue_success = True
+        context.state["rebase_continue_success"] = True
     except subprocess.CalledProcessError:
-        context.rebase_continue_success = False
+        context.state["rebase_continue_success"] = False
+    invalidate_markdown(context)
 
-    context.rebase_continue = True
+    context.state["rebase_continue"] = True
 
 
 # Verifications
@@ -348,9 +421,9 @@ def step_continue_rebase(context):
 def step_tracking_branch_created(context, branch_name):
     """Verify: Tracking branch exists."""
     repo = get_or_create_repo(context)
-    branches = repo.get_branch_list()
+    branches = repo_branches(context, repo)
     assert any(branch_name in b for b in branches), f"Branch {branch_name} not found"
-    context.tracking_branch_exists = True
+    context.state["tracking_branch_exists"] = True
 
 
 @then("tracking branch is checked out")
@@ -360,12 +433,12 @@ def step_tracking_branch_checked_out(context):
     tracking_branch = getattr(context, "tracking_branch", None)
     if tracking_branch:
         # Verify tracking branch exists
-        branches = repo.get_branch_list()
+        branches = repo_branches(context, repo)
         assert any(tracking_branch in b for b in branches), f"Tracking branch {tracking_branch} not found"
         # Verify it has commits
         count = repo.get_commit_count(tracking_branch)
         assert count > 1, f"Tracking branch should have commits, found {count}"
-    context.tracking_branch_current = True
+    context.state["tracking_branch_current"] = True
 
 
 @then("markdown file \"{filename}\" is committed to tracking branch")
@@ -373,7 +446,7 @@ def step_markdown_committed(context, filename):
     """Verify: File exists in tracking branch."""
     repo = get_or_create_repo(context)
     assert (repo.repo_path / filename).exists()
-    context.markdown_committed = True
+    context.state["markdown_committed"] = True
 
 
 @then("user is switched to feature branch \"{branch_name}\"")
@@ -381,16 +454,16 @@ def step_switched_to_feature_branch(context, branch_name):
     """Verify: Feature branch is checked out."""
     repo = get_or_create_repo(context)
     assert repo.get_current_branch() == branch_name
-    context.feature_branch_current = True
+    context.state["feature_branch_current"] = True
 
 
 @then("rebase completes successfully")
 def step_rebase_success(context):
     """Verify: Rebase completed without conflicts."""
     repo = get_or_create_repo(context)
-    status = repo.get_status()
+    status = repo_status(context, repo)
     assert not any(x in status for x in ["UU", "AA", "DD"])
-    context.rebase_success = True
+    context.state["rebase_success"] = True
 
 
 @then("feature branch has {n:d} commits replayed cleanly")
@@ -399,25 +472,25 @@ def step_commits_replayed(context, n):
     repo = get_or_create_repo(context)
     count = repo.get_commit_count()
     assert count >= n, f"Expected at least {n} commits, got {count}"
-    context.commits_replayed = n
+    context.state["payload"]["commits_replayed"] = n
 
 
 @then("local working tree is clean")
 def step_working_tree_clean(context):
     """Verify: No uncommitted changes."""
     repo = get_or_create_repo(context)
-    status = repo.get_status()
+    status = repo_status(context, repo)
     assert status == "", f"Working tree not clean: {status}"
-    context.working_tree_clean = True
+    context.state["working_tree_clean"] = True
 
 
 @then("rebase pauses with conflict marker")
 def step_rebase_conflict(context):
     """Verify: Rebase paused with conflicts."""
     repo = get_or_create_repo(context)
-    status = repo.get_status()
+    status = repo_status(context, repo)
     assert any(x in status for x in ["UU", "AA"]), "No conflicts found"
-    context.rebase_paused = True
+    context.state["rebase_paused"] = True
 
 
 @then("rebase completes")
@@ -427,18 +500,18 @@ def step_rebase_completes(context):
     # Check that there are no remaining merge/rebase in progress
     try:
         repo._run_git("rev-parse", "-q", "--verify", "REBASE_HEAD", check=False)
-        context.rebase_complete = False
+        context.state["rebase_complete"] = False
     except Exception:
-        context.rebase_complete = True
+        context.state["rebase_complete"] = True
 
 
 @then("feature branch is updated with resolved content")
 def step_feature_updated_resolved(context):
     """Verify: Feature branch has resolved content."""
     repo = get_or_create_repo(context)
-    status = repo.get_status()
+    status = repo_status(context, repo)
     assert status == "", "Unresolved conflicts remain"
-    context.feature_updated = True
+    context.state["feature_updated"] = True
 
 
 @then("all changes are synchronized")
@@ -453,7 +526,7 @@ def step_all_synced(context):
         tracking_commits = repo.get_commit_count(tracking_branch)
         assert tracking_commits > 0
 
-    context.all_synced = True
+    context.state["all_synced"] = True
 
 
 @then("git history shows all commits")
@@ -462,32 +535,7 @@ def step_git_history_complete(context):
     repo = get_or_create_repo(context)
     log = repo.get_log(max_count=100)
     assert len(log) > 0, "No commits in history"
-    context.history_complete = True
-
-
-@then("TargetProcess API is called to fetch latest state")
-def step_api_called_fetch(context):
-    """Verify: API fetch was called."""
-    # This is typically mocked in real tests
-    context.api_fetch_called = True
-
-
-@then("markdown is exported with fresh TP data")
-def step_markdown_exported(context):
-    """Verify: Markdown was exported."""
-    context.markdown_exported = True
-
-
-@then("tracking branch is updated with new markdown")
-def step_tracking_updated(context):
-    """Verify: Tracking branch was updated."""
-    context.tracking_updated = True
-
-
-@then("feature branch is rebased onto updated tracking branch")
-def step_feature_rebased(context):
-    """Verify: Feature branch rebased."""
-    context.feature_rebased = True
+    context.state["history_complete"] = True
 
 
 @then("commit message is preserved in git history")
@@ -497,35 +545,37 @@ def step_message_preserved(context):
     log = repo.get_log()
     # Check that at least some commits have messages
     assert len([l for l in log if len(l) > 7]) > 0
-    context.message_preserved = True
-
-
-@then("TargetProcess API call corresponds to commit intent")
-def step_api_matches_intent(context):
-    """Verify: API reflects commit intent."""
-    context.api_matches = True
+    context.state["message_preserved"] = True
 
 
 @then("switching branches works correctly")
 def step_branch_switch_ok(context):
     """Verify: Can switch branches."""
     repo = get_or_create_repo(context)
-    branches = repo.get_branch_list()
+    branches = repo_branches(context, repo)
     assert len(branches) > 1, "Multiple branches should exist"
-    context.switch_ok = True
-
-
-@then("PI-4/25 data is not affected")
-def step_pi4_unaffected(context):
-    """Verify: PI-4 data safe when working on PI-5."""
-    context.pi4_safe = True
+    context.state["switch_ok"] = True
 
 
 @then("each release has its own tracking branch")
 def step_each_release_has_tracking(context):
     """Verify: Each release has separate tracking branch."""
     repo = get_or_create_repo(context)
-    branches = repo.get_branch_list()
+    branches = repo_branches(context, repo)
     # Should have branches for different releases
     assert len(branches) >= 2
-    context.tracking_per_release = True
+    context.state["tracking_per_release"] = True
+
+
+# Verifications of mocked TargetProcess behaviour: nothing to check in the
+# git repo, so the step only records that it ran.
+TRIVIAL_STEPS = [
+    ("then", "TargetProcess API is called to fetch latest state", "api_fetch_called"),
+    ("then", "markdown is exported with fresh TP data", "markdown_exported"),
+    ("then", "tracking branch is updated with new markdown", "tracking_updated"),
+    ("then", "feature branch is rebased onto updated tracking branch", "feature_rebased"),
+    ("then", "TargetProcess API call corresponds to commit intent", "api_matches"),
+    ("then", "PI-4/25 data is not affected", "pi4_safe"),
+]
+
+register_flag_steps(TRIVIAL_STEPS, record_state_flag)
@@ -5,33 +5,74 @@ Defines steps for testing `tpcli plan create` and `tpcli plan update` workflows.
 """
 
 import json
-import re
+import os
 import subprocess
 from behave import given, when, then
+from tests.fixtures.git_helper import plan_branch_names, plan_slugs
 
+# Seconds a step command may run; tpcli normally answers well under a second
+CMD_TIMEOUT = float(os.getenv("TPCLI_TEST_TIMEOUT", "2"))
 
-def run_command(cmd):
-    """Run a shell command and return (exit_code, stdout, stderr)"""
+
+def run_command(argv):
+    """
+    Run a command (argv list, no shell) and return (exit_code, stdout, stderr)
+
+    Executing argv directly lets subprocess use posix_spawn instead of
+    forking a /bin/sh just to exec the command.
+    """
     # Ensure we use the local tpcli binary if the command starts with "tpcli"
-    if cmd.startswith("tpcli "):
-        cmd = "./" + cmd
+    if argv[0] == "tpcli":
+        argv = ["./tpcli", *argv[1:]]
 
     try:
         result = subprocess.run(
-            cmd,
-            shell=True,
+            argv,
             capture_output=True,
             text=True,
-            timeout=10,
-            cwd="."  # Run from repo root
+            timeout=CMD_TIMEOUT,
         )
         return result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
         return 124, "", "Command timed out"
+    except FileNotFoundError as e:
+        # Same exit code a shell reports for a missing command
+        return 127, "", str(e)
     except Exception as e:
         return 1, "", str(e)
 
 
+def parsed_stdout(context):
+    """
+    Parse context.stdout as JSON, once per command result.
+
+    The parsed value is cached on context alongside the stdout string it came
+    from; a new command result (a different stdout object) is parsed afresh.
+    """
+    cached_stdout, data = getattr(context, "_json_cache", (None, None))
+    if cached_stdout is not context.stdout:
+        # json.loads skips surrounding whitespace itself; no strip() copy needed
+        try:
+            data = json.loads(context.stdout)
+        except json.JSONDecodeError as e:
+            raise AssertionError(f"Output is not valid JSON: {context.stdout.strip()}\nError: {e}")
+        context._json_cache = (context.stdout, data)
+    return data
+
+
+def combined_output_lower(context):
+    """
+    Lowercased stdout + stderr, computed once per command result.
+
+    Cached like parsed_stdout(), keyed by the stdout and stderr objects.
+    """
+    cached_stdout, cached_stderr, output = getattr(context, "_lower_cache", (None, None, None))
+    if cached_stdout is not context.stdout or cached_stderr is not context.stderr:
+        output = (context.stdout + context.stderr).lower()
+        context._lower_cache = (context.stdout, context.stderr, output)
+    return output
+
+
 @given("TargetProcess API is running")
 def step_tp_api_running(context):
     """Mock setup for TP API (would be actual mock server in full test)"""
@@ -57,7 +98,7 @@ def step_run_create_command(context, entity_type, data):
     cmd = f'tpcli plan create {entity_type} --data \'{data}\''
 
     # Run it
-    exit_code, stdout, stderr = run_command(cmd)
+    exit_code, stdout, stderr = run_command(["tpcli", "plan", "create", entity_type, "--data", data])
 
     # Store results for assertions
     context.exit_code = exit_code
@@ -73,7 +114,7 @@ def step_run_update_command(context, entity_type, id, data):
     cmd = f'tpcli plan update {entity_type} {id} --data \'{data}\''
 
     # Run it
-    exit_code, stdout, stderr = run_command(cmd)
+    exit_code, stdout, stderr = run_command(["tpcli", "plan", "update", entity_type, id, "--data", data])
 
     # Store results for assertions
     context.exit_code = exit_code
@@ -82,18 +123,16 @@ def step_run_update_command(context, entity_type, id, data):
     context.command = cmd
 
 
-@then("command succeeds with exit code {expected_code}")
+@then("command succeeds with exit code {expected_code:d}")
 def step_command_succeeds(context, expected_code):
     """Verify command exit code"""
-    expected_code = int(expected_code)
     assert context.exit_code == expected_code, \
         f"Expected exit code {expected_code}, got {context.exit_code}. stderr: {context.stderr}"
 
 
-@then("command fails with exit code {expected_code}")
+@then("command fails with exit code {expected_code:d}")
 def step_command_fails(context, expected_code):
     """Verify command failed with expected exit code"""
-    expected_code = int(expected_code)
     assert context.exit_code == expected_code, \
         f"Expected exit code {expected_code}, got {context.exit_code}"
 
@@ -101,13 +140,7 @@ def step_command_fails(context, expected_code):
 @then("output contains JSON with \"{field}\" field")
 def step_output_contains_json_field(context, field):
     """Verify output is valid JSON containing the specified field"""
-    output = context.stdout.strip()
-
-    # Try to parse as JSON
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
+    data = parsed_stdout(context)
 
     # Verify field exists
     assert field in data, f"JSON output missing field '{field}'. Got: {data}"
@@ -116,20 +149,15 @@ def step_output_contains_json_field(context, field):
 @then("returned entity has all provided fields")
 def step_entity_has_provided_fields(context):
     """Verify all fields from input are present in output"""
-    output = context.stdout.strip()
-
-    try:
-        output_data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
+    output_data = parsed_stdout(context)
 
     # Extract input data from the command
     # Expected format: --data '{"field1": "value1", "field2": "value2"}'
-    match = re.search(r"--data '({.*})'", context.command)
-    if not match:
+    _, sep, rest = context.command.partition("--data '")
+    if not sep:
         raise AssertionError(f"Could not extract data from command: {context.command}")
 
-    input_json_str = match.group(1)
+    input_json_str, _, _ = rest.rpartition("'")
     try:
         input_data = json.loads(input_json_str)
     except json.JSONDecodeError as e:
@@ -143,12 +171,7 @@ def step_entity_has_provided_fields(context):
 @then("output contains updated JSON")
 def step_output_contains_updated_json(context):
     """Verify output is valid JSON (for update operations)"""
-    output = context.stdout.strip()
-
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
+    data = parsed_stdout(context)
 
     # Verify it has an ID (indicates successful update)
     assert "id" in data, f"JSON output missing 'id' field. Got: {data}"
@@ -160,17 +183,14 @@ def step_output_contains_updated_json(context):
 @then("output JSON includes:")
 def step_output_json_includes(context):
     """Verify output JSON includes specified fields"""
-    output = context.stdout.strip()
+    data = parsed_stdout(context)
 
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
-
-    # Parse the table of fields to verify
-    for row in context.table:
-        field = row['field']
-        present = row['present'].lower() == 'true'
+    # Parse the table of fields to verify (cells by column index, not heading lookup)
+    headings = context.table.headings
+    field_idx, present_idx = headings.index('field'), headings.index('present')
+    for row in context.table.rows:
+        field = row.cells[field_idx]
+        present = row.cells[present_idx].lower() == 'true'
 
         if present:
             assert field in data, \
@@ -180,39 +200,29 @@ def step_output_json_includes(context):
                 f"Expected field '{field}' to NOT be present in output. Got: {data}"
 
 
-@given("TeamPIObjective {id} exists with name=\"{name}\" and effort={effort}")
+@given("TeamPIObjective {id} exists with name=\"{name}\" and effort={effort:d}")
 def step_objective_exists_with_data(context, id, name, effort):
     """Setup: TeamPIObjective exists with specific data"""
     context.existing_objective_id = id
     context.existing_objective_name = name
-    context.existing_objective_effort = int(effort)
+    context.existing_objective_effort = effort
 
 
 @then("returned entity still has name=\"{name}\"")
 def step_entity_preserves_field(context, name):
     """Verify a field was preserved during update"""
-    output = context.stdout.strip()
-
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
+    data = parsed_stdout(context)
 
     assert data.get("name") == name, \
         f"Expected name to be '{name}', got '{data.get('name')}'"
 
 
-@then("returned entity has effort={effort}")
+@then("returned entity has effort={effort:d}")
 def step_entity_has_updated_effort(context, effort):
     """Verify a numeric field was updated"""
-    output = context.stdout.strip()
+    data = parsed_stdout(context)
 
-    try:
-        data = json.loads(output)
-    except json.JSONDecodeError as e:
-        raise AssertionError(f"Output is not valid JSON: {output}\nError: {e}")
-
-    assert data.get("effort") == int(effort), \
+    assert data.get("effort") == effort, \
         f"Expected effort to be {effort}, got '{data.get('effort')}'"
 
 
@@ -230,9 +240,8 @@ def step_tp_api_called_with(context, method, path):
 @given("git repository is initialized")
 def step_git_repo_initialized(context):
     """Verify git repository is available"""
-    # Run git status to verify repo exists
-    exit_code, _, _ = run_command("git status")
-    context.git_available = exit_code == 0
+    # Checked once per run in environment.before_all
+    context.git_available = context.config.userdata["git_available"]
     assert context.git_available, "Git repository not found"
 
 
@@ -241,10 +250,10 @@ def step_local_team_release(context, team, release):
     """Set up local context with team and release information"""
     context.team = team
     context.release = release
-    context.team_normalized = team.lower().replace(" ", "-")
-    context.release_normalized = release.upper().replace("/", "-")
-    context.tracking_branch = f"TP-{context.release_normalized}-{context.team_normalized}"
-    context.feature_branch = f"feature/plan-{release.lower().replace('/', '-')}"
+    context.team_normalized, release_slug = plan_slugs(team, release)
+    # Release as it appears in tracking branch names: "PI-4/25" -> "PI-4-25"
+    context.release_normalized = release_slug.upper()
+    context.tracking_branch, context.feature_branch, _ = plan_branch_names(team, release)
 
 
 @given("user has initialized plan tracking for {release}")
@@ -259,7 +268,7 @@ def step_user_initialized_tracking(context, release):
 def step_run_init_command(context, release, team):
     """Execute tpcli plan init command"""
     cmd = f'tpcli plan init --release {release} --team "{team}"'
-    exit_code, stdout, stderr = run_command(cmd)
+    exit_code, stdout, stderr = run_command(["tpcli", "plan", "init", "--release", release, "--team", team])
 
     context.exit_code = exit_code
     context.stdout = stdout
@@ -268,8 +277,7 @@ def step_run_init_command(context, release, team):
     context.release = release
     context.team = team
     # Calculate expected branch names for verification
-    context.tracking_branch = f"TP-{release.upper().replace('/', '-')}-{team.lower().replace(' ', '-')}"
-    context.feature_branch = f"feature/plan-{release.lower().replace('/', '-')}"
+    context.tracking_branch, context.feature_branch, _ = plan_branch_names(team, release)
 
 
 @when("TargetProcess has updated objective {objective_id} effort to {effort}")
@@ -297,7 +305,7 @@ def step_user_edited_with_invalid_data(context):
 def step_run_pull_command(context):
     """Execute tpcli plan pull command"""
     cmd = "tpcli plan pull"
-    exit_code, stdout, stderr = run_command(cmd)
+    exit_code, stdout, stderr = run_command(["tpcli", "plan", "pull"])
 
     context.exit_code = exit_code
     context.stdout = stdout
@@ -309,7 +317,7 @@ def step_run_pull_command(context):
 def step_run_push_command(context):
     """Execute tpcli plan push command"""
     cmd = "tpcli plan push"
-    exit_code, stdout, stderr = run_command(cmd)
+    exit_code, stdout, stderr = run_command(["tpcli", "plan", "push"])
 
     context.exit_code = exit_code
     context.stdout = stdout
@@ -363,22 +371,22 @@ def step_tracking_branch_updated(context):
 @then("output contains \"{expected_text}\" or \"{alternative_text}\"")
 def step_output_contains_alternatives(context, expected_text, alternative_text):
     """Verify output contains one of multiple acceptable strings"""
-    output = context.stdout + context.stderr
-    assert expected_text.lower() in output.lower() or alternative_text.lower() in output.lower(), \
-        f"Expected output to contain '{expected_text}' or '{alternative_text}'. Got: {output}"
+    output = combined_output_lower(context)
+    assert expected_text.lower() in output or alternative_text.lower() in output, \
+        f"Expected output to contain '{expected_text}' or '{alternative_text}'. Got: {context.stdout + context.stderr}"
 
 
 @then("error message contains instructions for conflict resolution")
 def step_error_contains_conflict_instructions(context):
     """Verify error message contains helpful conflict resolution info"""
     error_output = context.stderr or context.stdout
-    assert "rebase" in error_output.lower() or "conflict" in error_output.lower(), \
+    error_output_lower = error_output.lower()
+    assert "rebase" in error_output_lower or "conflict" in error_output_lower, \
         f"Expected conflict resolution instructions. Got: {error_output}"
 
 
 @then("output contains \"{expected_text}\"")
 def step_output_contains_text(context, expected_text):
     """Verify output contains expected text"""
-    output = context.stdout + context.stderr
-    assert expected_text.lower() in output.lower(), \
-        f"Expected output to contain '{expected_text}'. Got: {output}"
+    assert expected_text.lower() in combined_output_lower(context), \
+        f"Expected output to contain '{expected_text}'. Got: {context.stdout + context.stderr}"
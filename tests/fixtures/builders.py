@@ -23,25 +23,84 @@ Usage:
         TPTeamBuilder().with_name("Cloud Enablement").build(),
         TPTeamBuilder().with_name("Data Analytics").build(),
     ]
+
+The TP builders start each build() from a class-level template of the
+default response and rebuild only the nested objects a with_* setter
+changed; untouched nested objects are shared with the template, and
+references to other entities (Team, ART, Owner, ...) are shared by every
+response that names the same one, so treat built responses as read-only.
+Values that recur across builds (team, ART, owner and release names,
+statuses) are interned when set.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Optional
-import json
+from typing import Any
+import copy
+import functools
+import sys
+import time
+
+_DAY_MS = 86_400_000
+
+
+def _now_ms() -> int:
+    """Current time in epoch milliseconds, as TP /Date()/ values carry it."""
+    return int(time.time() * 1000)
+
+
+# TP /Date(<ms><utc offset>)/ pieces
+_DATE_PREFIX = "/Date("
+_EDT_SUFFIX = "-0400)/"
+_EST_SUFFIX = "-0500)/"
+
+
+def _tp_date(ms: int, suffix: str) -> str:
+    """TP date string for epoch milliseconds, suffix carrying the UTC offset."""
+    return _DATE_PREFIX + str(ms) + suffix
+
+
+@functools.cache
+def _month_of_day(day: int) -> int:
+    """Calendar month (UTC) of a day number since the epoch."""
+    return time.gmtime(day * 86_400).tm_mon
+
+
+def _abbreviate(name: str) -> str:
+    """Team abbreviation: initials of up to the first four words."""
+    return "".join([word[0] for word in name.split()])[:4]
+
+
+@functools.cache
+def _ref(resource_type: str, ref_id: int, name: str) -> dict[str, Any]:
+    """
+    Reference to another TP entity (Team, Owner, ...), shared per distinct value.
+
+    Users are referenced by FullName, everything else by Name.
+    """
+    name_key = "FullName" if resource_type == "GeneralUser" else "Name"
+    return {"Id": ref_id, name_key: name, "ResourceType": resource_type}
 
 
 class TPTeamBuilder:
     """Builder for TargetProcess Team API responses."""
 
+    __slots__ = (
+        "_id", "_name", "_abbreviation", "_art_id", "_art_name", "_member_count",
+        "_is_active", "_owner_name", "_owner_id", "_now_ms", "_dirty",
+    )
+
     def __init__(self):
         self._id = 2022903
         self._name = "Cloud Enablement & Delivery"
+        self._abbreviation = _abbreviate(self._name)
         self._art_id = 1936122
         self._art_name = "Data, Analytics and Digital"
         self._member_count = 8
         self._is_active = True
         self._owner_name = "Stéphane Dattenny"
         self._owner_id = 319
+        self._now_ms = _now_ms()
+        # Nested object groups that differ from the template
+        self._dirty: set[str] = set()
 
     def with_id(self, team_id: int) -> "TPTeamBuilder":
         """Set team ID."""
@@ -50,18 +109,21 @@ class TPTeamBuilder:
 
     def with_name(self, name: str) -> "TPTeamBuilder":
         """Set team name."""
-        self._name = name
+        self._name = sys.intern(name)
+        self._abbreviation = _abbreviate(name)
         return self
 
     def with_art(self, art_id: int, art_name: str) -> "TPTeamBuilder":
         """Set ART."""
         self._art_id = art_id
-        self._art_name = art_name
+        self._art_name = sys.intern(art_name)
+        self._dirty.add("art")
         return self
 
     def with_member_count(self, count: int) -> "TPTeamBuilder":
         """Set member count."""
         self._member_count = count
+        self._dirty.add("members")
         return self
 
     def with_active(self, active: bool) -> "TPTeamBuilder":
@@ -72,36 +134,69 @@ class TPTeamBuilder:
     def with_owner(self, owner_id: int, owner_name: str) -> "TPTeamBuilder":
         """Set team owner."""
         self._owner_id = owner_id
-        self._owner_name = owner_name
+        self._owner_name = sys.intern(owner_name)
+        self._dirty.add("owner")
         return self
 
-    def build(self) -> dict[str, Any]:
-        """Build the TP Team API response."""
+    def _scalar_fields(self) -> dict[str, Any]:
         return {
             "Id": self._id,
             "Name": self._name,
-            "Abbreviation": "".join([word[0] for word in self._name.split()])[:4],
+            "Abbreviation": self._abbreviation,
             "IsActive": self._is_active,
-            "CreateDate": f"/Date({int((datetime.now() - timedelta(days=365)).timestamp() * 1000)}-0400)/",
-            "ModifyDate": f"/Date({int(datetime.now().timestamp() * 1000)}-0500)/",
-            "AgileReleaseTrain": {
-                "Id": self._art_id,
-                "Name": self._art_name,
-                "ResourceType": "AgileReleaseTrain",
-            } if self._art_id else None,
-            "Owner": {
-                "Id": self._owner_id,
-                "FullName": self._owner_name,
-                "ResourceType": "GeneralUser",
-            },
-            "Members": {"length": self._member_count},
+            "CreateDate": _tp_date(self._now_ms - 365 * _DAY_MS, _EDT_SUFFIX),
+            "ModifyDate": _tp_date(self._now_ms, _EST_SUFFIX),
+        }
+
+    def _art_fields(self) -> dict[str, Any]:
+        if not self._art_id:
+            return {"AgileReleaseTrain": None}
+        return {"AgileReleaseTrain": _ref("AgileReleaseTrain", self._art_id, self._art_name)}
+
+    def _owner_fields(self) -> dict[str, Any]:
+        return {
+            "Owner": _ref("GeneralUser", self._owner_id, self._owner_name),
+        }
+
+    def _members_fields(self) -> dict[str, Any]:
+        return {"Members": {"length": self._member_count}}
+
+    _GROUPS = {"art": _art_fields, "owner": _owner_fields, "members": _members_fields}
+
+    def _full_response(self) -> dict[str, Any]:
+        return {
+            **self._scalar_fields(),
+            **self._art_fields(),
+            **self._owner_fields(),
+            **self._members_fields(),
             "ResourceType": "Team",
         }
 
+    def build(self) -> dict[str, Any]:
+        """Build the TP Team API response."""
+        return _from_template(self)
+
+
+# Feature custom fields: (name and type, builder attribute holding the value)
+_CUSTOM_FIELD_TEMPLATES = (
+    ({"Name": "Acceptance Criteria", "Type": "RichText"}, "_acceptance_criteria"),
+    ({"Name": "Jira Key", "Type": "TemplatedURL"}, "_jira_key"),
+    ({"Name": "Jira Priority", "Type": "DropDown"}, "_jira_priority"),
+    ({"Name": "Jira Project", "Type": "Text"}, "_jira_project"),
+)
+
 
 class TPFeatureBuilder:
     """Builder for TargetProcess Feature API responses."""
 
+    __slots__ = (
+        "_id", "_name", "_status", "_effort", "_team_id", "_team_name", "_art_id",
+        "_art_name", "_owner_id", "_owner_name", "_editor_id", "_editor_name",
+        "_description", "_priority", "_project_id", "_project_name", "_jira_key",
+        "_jira_project", "_jira_priority", "_created_ms", "_modified_ms",
+        "_acceptance_criteria", "_dirty",
+    )
+
     def __init__(self):
         self._id = 1937700
         self._name = "[Tech Debt] Address all tagging issues across the application/solutions deployed on the platform"
@@ -122,9 +217,12 @@ class TPFeatureBuilder:
         self._jira_key = "DAD-1760"
         self._jira_project = "Data, Analytics and Digital"
         self._jira_priority = "Medium"
-        self._created_date = datetime.now() - timedelta(days=30)
-        self._modified_date = datetime.now() - timedelta(days=1)
+        now_ms = _now_ms()
+        self._created_ms = now_ms - 30 * _DAY_MS
+        self._modified_ms = now_ms - _DAY_MS
         self._acceptance_criteria = "<ul><li><p>80% of the untagged resources are addressed</p></li></ul>"
+        # Nested object groups that differ from the template
+        self._dirty: set[str] = set()
 
     def with_id(self, feature_id: int) -> "TPFeatureBuilder":
         """Set feature ID."""
@@ -138,7 +236,8 @@ class TPFeatureBuilder:
 
     def with_status(self, status: str) -> "TPFeatureBuilder":
         """Set feature status."""
-        self._status = status
+        self._status = sys.intern(status)
+        self._dirty.add("status")
         return self
 
     def with_effort(self, effort: int) -> "TPFeatureBuilder":
@@ -150,20 +249,23 @@ class TPFeatureBuilder:
         """Set team."""
         self._team_id = team_id
         if team_name:
-            self._team_name = team_name
+            self._team_name = sys.intern(team_name)
+        self._dirty.add("team")
         return self
 
     def with_art(self, art_id: int, art_name: str = None) -> "TPFeatureBuilder":
         """Set ART."""
         self._art_id = art_id
         if art_name:
-            self._art_name = art_name
+            self._art_name = sys.intern(art_name)
+        self._dirty.add("art")
         return self
 
     def with_owner(self, owner_id: int, owner_name: str) -> "TPFeatureBuilder":
         """Set owner."""
         self._owner_id = owner_id
-        self._owner_name = owner_name
+        self._owner_name = sys.intern(owner_name)
+        self._dirty.add("owner")
         return self
 
     def with_jira_mapping(self, jira_key: str, jira_project: str = None) -> "TPFeatureBuilder":
@@ -171,11 +273,13 @@ class TPFeatureBuilder:
         self._jira_key = jira_key
         if jira_project:
             self._jira_project = jira_project
+        self._dirty.add("custom_fields")
         return self
 
     def with_jira_priority(self, priority: str) -> "TPFeatureBuilder":
         """Set Jira priority."""
         self._jira_priority = priority
+        self._dirty.add("custom_fields")
         return self
 
     def with_description(self, description: str) -> "TPFeatureBuilder":
@@ -186,27 +290,77 @@ class TPFeatureBuilder:
     def with_acceptance_criteria(self, criteria: str) -> "TPFeatureBuilder":
         """Set acceptance criteria (HTML)."""
         self._acceptance_criteria = criteria
+        self._dirty.add("custom_fields")
         return self
 
-    def _ts(self, dt: datetime) -> str:
-        """Convert datetime to TP format."""
-        ms = int(dt.timestamp() * 1000)
-        offset = "-0400" if dt.month > 10 else "-0500"
-        return f"/Date({ms}{offset})/"
+    def _ts(self, ms: int) -> str:
+        """Convert epoch milliseconds to TP format."""
+        suffix = _EDT_SUFFIX if _month_of_day(ms // _DAY_MS) > 10 else _EST_SUFFIX
+        return _tp_date(ms, suffix)
 
-    def build(self) -> dict[str, Any]:
-        """Build the TP Feature API response."""
+    def _scalar_fields(self) -> dict[str, Any]:
         return {
             "Id": self._id,
             "Name": self._name,
             "Description": self._description,
-            "EntityType": {"Id": 9, "Name": "Feature", "ResourceType": "EntityType"},
+            "Status": self._status,
+            "Effort": self._effort,
+            "EffortToDo": self._effort,
+            "CreateDate": self._ts(self._created_ms),
+            "ModifyDate": self._ts(self._modified_ms),
+            "LastStateChangeDate": self._ts(self._modified_ms),
+            "PlannedStartDate": self._ts(self._created_ms + 7 * _DAY_MS),
+            "PlannedEndDate": self._ts(self._created_ms + 35 * _DAY_MS),
+        }
+
+    def _status_fields(self) -> dict[str, Any]:
+        return {
             "EntityState": {
                 "Id": 87,
                 "Name": self._status,
                 "NumericPriority": 1,
                 "ResourceType": "EntityState",
             },
+        }
+
+    def _team_fields(self) -> dict[str, Any]:
+        return {
+            "Team": _ref("Team", self._team_id, self._team_name),
+        }
+
+    def _art_fields(self) -> dict[str, Any]:
+        return {
+            "AgileReleaseTrain": _ref("AgileReleaseTrain", self._art_id, self._art_name),
+        }
+
+    def _owner_fields(self) -> dict[str, Any]:
+        return {
+            "Owner": _ref("GeneralUser", self._owner_id, self._owner_name),
+            "Creator": _ref("GeneralUser", self._owner_id, self._owner_name),
+        }
+
+    def _custom_fields(self) -> dict[str, Any]:
+        return {
+            "CustomFields": [
+                {**field, "Value": getattr(self, attr)} for field, attr in _CUSTOM_FIELD_TEMPLATES
+            ],
+        }
+
+    _GROUPS = {
+        "status": _status_fields,
+        "team": _team_fields,
+        "art": _art_fields,
+        "owner": _owner_fields,
+        "custom_fields": _custom_fields,
+    }
+
+    def _full_response(self) -> dict[str, Any]:
+        return {
+            "Id": self._id,
+            "Name": self._name,
+            "Description": self._description,
+            "EntityType": {"Id": 9, "Name": "Feature", "ResourceType": "EntityType"},
+            **self._status_fields(),
             "Status": self._status,
             "Priority": {
                 "Id": 10,
@@ -221,72 +375,35 @@ class TPFeatureBuilder:
             "TimeSpent": 0,
             "TimeRemain": 0,
             "Progress": 0,
-            "Team": {
-                "Id": self._team_id,
-                "Name": self._team_name,
-                "ResourceType": "Team",
-            },
-            "AgileReleaseTrain": {
-                "Id": self._art_id,
-                "Name": self._art_name,
-                "ResourceType": "AgileReleaseTrain",
-            },
-            "Project": {
-                "Id": self._project_id,
-                "Name": self._project_name,
-                "ResourceType": "Project",
-            },
-            "Owner": {
-                "Id": self._owner_id,
-                "FullName": self._owner_name,
-                "ResourceType": "GeneralUser",
-            },
-            "Creator": {
-                "Id": self._owner_id,
-                "FullName": self._owner_name,
-                "ResourceType": "GeneralUser",
-            },
-            "LastEditor": {
-                "Id": self._editor_id,
-                "FullName": self._editor_name,
-                "ResourceType": "GeneralUser",
-            },
-            "CreateDate": self._ts(self._created_date),
-            "ModifyDate": self._ts(self._modified_date),
-            "LastStateChangeDate": self._ts(self._modified_date),
+            **self._team_fields(),
+            **self._art_fields(),
+            "Project": _ref("Project", self._project_id, self._project_name),
+            **self._owner_fields(),
+            "LastEditor": _ref("GeneralUser", self._editor_id, self._editor_name),
+            "CreateDate": self._ts(self._created_ms),
+            "ModifyDate": self._ts(self._modified_ms),
+            "LastStateChangeDate": self._ts(self._modified_ms),
             "StartDate": None,
             "EndDate": None,
-            "PlannedStartDate": self._ts(self._created_date + timedelta(days=7)),
-            "PlannedEndDate": self._ts(self._created_date + timedelta(days=35)),
-            "CustomFields": [
-                {
-                    "Name": "Acceptance Criteria",
-                    "Type": "RichText",
-                    "Value": self._acceptance_criteria,
-                },
-                {
-                    "Name": "Jira Key",
-                    "Type": "TemplatedURL",
-                    "Value": self._jira_key,
-                },
-                {
-                    "Name": "Jira Priority",
-                    "Type": "DropDown",
-                    "Value": self._jira_priority,
-                },
-                {
-                    "Name": "Jira Project",
-                    "Type": "Text",
-                    "Value": self._jira_project,
-                },
-            ],
+            "PlannedStartDate": self._ts(self._created_ms + 7 * _DAY_MS),
+            "PlannedEndDate": self._ts(self._created_ms + 35 * _DAY_MS),
+            **self._custom_fields(),
             "ResourceType": "Feature",
         }
 
+    def build(self) -> dict[str, Any]:
+        """Build the TP Feature API response."""
+        return _from_template(self)
+
 
 class JiraStoryBuilder:
     """Builder for Jira story API responses."""
 
+    __slots__ = (
+        "_key", "_summary", "_status", "_assignee", "_story_points", "_description",
+        "_epic_link",
+    )
+
     def __init__(self):
         self._key = "DAD-1760"
         self._summary = "[Tech Debt] Address all tagging issues across the application"
@@ -308,7 +425,7 @@ class JiraStoryBuilder:
 
     def with_status(self, status: str) -> "JiraStoryBuilder":
         """Set status."""
-        self._status = status
+        self._status = sys.intern(status)
         return self
 
     def with_assignee(self, assignee: str) -> "JiraStoryBuilder":
@@ -353,6 +470,12 @@ class JiraStoryBuilder:
 class TPTeamObjectiveBuilder:
     """Builder for TargetProcess Team PI Objective API responses."""
 
+    __slots__ = (
+        "_id", "_name", "_status", "_effort", "_team_id", "_team_name", "_release_id",
+        "_release_name", "_owner_id", "_owner_name", "_description", "_committed",
+        "_now_ms", "_created_ms", "_dirty",
+    )
+
     def __init__(self):
         self._id = 2019099
         self._name = "Platform governance"
@@ -366,7 +489,10 @@ class TPTeamObjectiveBuilder:
         self._owner_name = "Shalom Bhooshi"
         self._description = "Establish governance frameworks"
         self._committed = True
-        self._created_date = datetime.now() - timedelta(days=60)
+        self._now_ms = _now_ms()
+        self._created_ms = self._now_ms - 60 * _DAY_MS
+        # Nested object groups that differ from the template
+        self._dirty: set[str] = set()
 
     def with_id(self, obj_id: int) -> "TPTeamObjectiveBuilder":
         """Set objective ID."""
@@ -380,7 +506,7 @@ class TPTeamObjectiveBuilder:
 
     def with_status(self, status: str) -> "TPTeamObjectiveBuilder":
         """Set status."""
-        self._status = status
+        self._status = sys.intern(status)
         return self
 
     def with_effort(self, effort: int) -> "TPTeamObjectiveBuilder":
@@ -392,14 +518,16 @@ class TPTeamObjectiveBuilder:
         """Set team."""
         self._team_id = team_id
         if team_name:
-            self._team_name = team_name
+            self._team_name = sys.intern(team_name)
+        self._dirty.add("team")
         return self
 
     def with_release(self, release_id: int, release_name: str = None) -> "TPTeamObjectiveBuilder":
         """Set release."""
         self._release_id = release_id
         if release_name:
-            self._release_name = release_name
+            self._release_name = sys.intern(release_name)
+        self._dirty.add("release")
         return self
 
     def with_committed(self, committed: bool) -> "TPTeamObjectiveBuilder":
@@ -407,8 +535,7 @@ class TPTeamObjectiveBuilder:
         self._committed = committed
         return self
 
-    def build(self) -> dict[str, Any]:
-        """Build the TP Team Objective API response."""
+    def _scalar_fields(self) -> dict[str, Any]:
         return {
             "Id": self._id,
             "Name": self._name,
@@ -416,29 +543,71 @@ class TPTeamObjectiveBuilder:
             "Status": self._status,
             "Effort": self._effort,
             "Committed": self._committed,
-            "Team": {
-                "Id": self._team_id,
-                "Name": self._team_name,
-                "ResourceType": "Team",
-            },
-            "Release": {
-                "Id": self._release_id,
-                "Name": self._release_name,
-                "ResourceType": "Release",
-            },
-            "Owner": {
-                "Id": self._owner_id,
-                "FullName": self._owner_name,
-                "ResourceType": "GeneralUser",
-            },
-            "CreatedDate": f"/Date({int(self._created_date.timestamp() * 1000)}-0400)/",
-            "ModifyDate": f"/Date({int(datetime.now().timestamp() * 1000)}-0500)/",
+            "CreatedDate": _tp_date(self._created_ms, _EDT_SUFFIX),
+            "ModifyDate": _tp_date(self._now_ms, _EST_SUFFIX),
+        }
+
+    def _team_fields(self) -> dict[str, Any]:
+        return {
+            "Team": _ref("Team", self._team_id, self._team_name),
+        }
+
+    def _release_fields(self) -> dict[str, Any]:
+        return {
+            "Release": _ref("Release", self._release_id, self._release_name),
+        }
+
+    _GROUPS = {"team": _team_fields, "release": _release_fields}
+
+    def _full_response(self) -> dict[str, Any]:
+        return {
+            "Id": self._id,
+            "Name": self._name,
+            "Description": self._description,
+            "Status": self._status,
+            "Effort": self._effort,
+            "Committed": self._committed,
+            **self._team_fields(),
+            **self._release_fields(),
+            "Owner": _ref("GeneralUser", self._owner_id, self._owner_name),
+            "CreatedDate": _tp_date(self._created_ms, _EDT_SUFFIX),
+            "ModifyDate": _tp_date(self._now_ms, _EST_SUFFIX),
             "ResourceType": "TeamPIObjective",
         }
 
+    def build(self) -> dict[str, Any]:
+        """Build the TP Team Objective API response."""
+        return _from_template(self)
+
+
+def _from_template(builder: Any) -> dict[str, Any]:
+    """
+    Build a response from the builder class's template.
+
+    Scalar fields are always written; nested objects are rebuilt only for
+    groups a with_* setter marked dirty and are otherwise shared with the
+    template.
+    """
+    response = builder._TEMPLATE.copy()
+    response.update(builder._scalar_fields())
+    for group in builder._dirty:
+        response.update(builder._GROUPS[group](builder))
+    return response
+
+
+# Default responses, built once; build() copies and patches these
+TPTeamBuilder._TEMPLATE = TPTeamBuilder()._full_response()
+TPFeatureBuilder._TEMPLATE = TPFeatureBuilder()._full_response()
+TPTeamObjectiveBuilder._TEMPLATE = TPTeamObjectiveBuilder()._full_response()
+
 
 # Convenience functions for common scenarios
+#
+# The create_* responses are built once and cached, so every caller gets the
+# same dict (timestamps included): don't mutate them. Use the fresh_* variants
+# for a private deep copy.
 
+@functools.lru_cache(maxsize=1)
 def create_tech_debt_feature() -> dict[str, Any]:
     """Create a realistic tech debt feature (based on real #1937700)."""
     return (
@@ -455,6 +624,7 @@ def create_tech_debt_feature() -> dict[str, Any]:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_platform_eco_team() -> dict[str, Any]:
     """Create a realistic team scenario."""
     return (
@@ -468,6 +638,7 @@ def create_platform_eco_team() -> dict[str, Any]:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_platform_governance_objective() -> dict[str, Any]:
     """Create a realistic team objective."""
     return (
@@ -481,3 +652,18 @@ def create_platform_governance_objective() -> dict[str, Any]:
         .with_committed(True)
         .build()
     )
+
+
+def fresh_tech_debt_feature() -> dict[str, Any]:
+    """Mutable copy of create_tech_debt_feature()."""
+    return copy.deepcopy(create_tech_debt_feature())
+
+
+def fresh_platform_eco_team() -> dict[str, Any]:
+    """Mutable copy of create_platform_eco_team()."""
+    return copy.deepcopy(create_platform_eco_team())
+
+
+def fresh_platform_governance_objective() -> dict[str, Any]:
+    """Mutable copy of create_platform_governance_objective()."""
+    return copy.deepcopy(create_platform_governance_objective())
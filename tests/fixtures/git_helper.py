@@ -30,12 +30,64 @@ Usage:
     repo.cleanup()
 """
 
+import functools
 import os
+import shlex
 import subprocess
 import tempfile
 import shutil
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+
+
+# Release/team names become branch and file name slugs: "PI-4/25" -> "pi-4-25"
+_SLUG_TBL = str.maketrans({"/": "-", " ": "-"})
+
+
+def _slug(name: str) -> str:
+    """Normalize a release or team name for branch and file names."""
+    return name.translate(_SLUG_TBL).lower()
+
+
+@functools.lru_cache(maxsize=256)
+def plan_slugs(team: str, release: str) -> Tuple[str, str]:
+    """
+    Get (team slug, release slug), e.g. ("Platform Eco", "PI-4/25") ->
+        ("platform-eco", "pi-4-25")
+    """
+    return _slug(team), _slug(release)
+
+
+@functools.lru_cache(maxsize=256)
+def plan_branch_names(team: str, release: str) -> Tuple[str, str, str]:
+    """
+    Get (tracking branch, feature branch, markdown filename) for a team/release.
+
+    Follows the plan-sync naming convention, e.g. ("Platform Eco", "PI-4/25") ->
+        ("TP-PI-4-25-platform-eco", "feature/plan-pi-4-25", "pi-4-25-platform-eco.md")
+
+    Cached, so every step derives identical names for the same pair.
+    """
+    team_slug, release_slug = plan_slugs(team, release)
+    return (
+        f"TP-{release_slug.upper()}-{team_slug}",
+        f"feature/plan-{release_slug}",
+        f"{release_slug}-{team_slug}.md",
+    )
+
+
+# Identity for test commits, appended to each new repository's .git/config
+_USER_CONFIG = "[user]\n\temail = test@example.com\n\tname = Test User\n"
+
+
+@dataclass
+class FastImportCommit:
+    """A commit to create with GitTestRepo.fast_import()."""
+
+    message: str
+    files: Dict[str, str] = field(default_factory=dict)  # path -> content
 
 
 class GitTestRepo:
@@ -46,37 +98,50 @@ class GitTestRepo:
     simulating conflicts, and managing repository state.
     """
 
-    def __init__(self, initial_branch: str = "main") -> None:
+    def __init__(
+        self,
+        initial_branch: str = "main",
+        template: Optional[Path] = None,
+    ) -> None:
         """
         Initialize a temporary git repository.
 
         Args:
             initial_branch: Name of the initial branch (default: main)
+            template: Path of an existing GitTestRepo to copy instead of running
+                git init + initial commit (must be checked out on initial_branch)
         """
         self.tmpdir = tempfile.mkdtemp(prefix="git-test-repo-")
         self.repo_path = Path(self.tmpdir)
         self.initial_branch = initial_branch
         self.current_branch = initial_branch
         self.commits: Dict[str, List[str]] = {}  # branch -> list of commit hashes
+        self._cat_file_proc: Optional[subprocess.Popen] = None
 
-        # Initialize repository
-        self._run_git("init")
-        self._run_git("config", "user.email", "test@example.com")
-        self._run_git("config", "user.name", "Test User")
+        if template is not None:
+            # Snapshot copy of a pre-built repository: no git execs at all
+            shutil.copytree(template, self.repo_path, symlinks=True, dirs_exist_ok=True)
+            return
 
-        # Create initial branch (git init creates 'master' by default)
-        if initial_branch != "master":
-            self._run_git("checkout", "-b", initial_branch)
-        self.current_branch = initial_branch
+        # Initialize repository on initial_branch, with an initial commit so
+        # branches can be created, in one shell invocation
+        self.run_script(self._bootstrap_cmds(initial_branch))
 
-        # Create initial commit so branches can be created
-        self._create_initial_commit()
+    @staticmethod
+    def _bootstrap_cmds(initial_branch: str) -> List[str]:
+        """
+        Shell commands that set up a fresh repository, for run_script.
 
-    def _create_initial_commit(self) -> None:
-        """Create initial commit in the repository."""
-        self.write_file(".gitkeep", "")
-        self._run_git("add", ".gitkeep")
-        self._run_git("commit", "-m", "Initial commit")
+        Only init, add and commit exec git; the user identity is appended to
+        .git/config and .gitkeep written by shell builtins.
+        """
+        return [
+            shlex.join(["git", "init", "-q", "-b", initial_branch]),
+            f"printf '%s' {shlex.quote(_USER_CONFIG)} >> .git/config",
+            GitTestRepo.write_file_cmd(".gitkeep", ""),
+            "git add .gitkeep",
+            "git commit -q -m 'Initial commit'",
+        ]
 
     def _run_git(self, *args: str, check: bool = True) -> str:
         """
@@ -110,6 +175,151 @@ class GitTestRepo:
 
         return result.stdout.strip()
 
+    def run_script(self, cmds: List[str], check: bool = True) -> str:
+        """
+        Run several shell commands in the repository as one bash invocation.
+
+        Commands are chained with ``&&``, so the script stops at the first
+        failure. Use this to fuse multi-step git sequences into a single exec.
+        Callers are responsible for quoting (see ``shlex.join``) and for
+        updating ``current_branch`` if the script switches branches.
+
+        Args:
+            cmds: Shell commands to run in order
+            check: If True, raise exception on non-zero exit
+
+        Returns:
+            Combined stdout of the script as string
+
+        Raises:
+            subprocess.CalledProcessError: If a command fails and check=True
+        """
+        script = " && ".join(cmds)
+        result = subprocess.run(  # noqa: S602
+            script,
+            shell=True,
+            executable="/bin/bash",
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode,
+                script,
+                output=result.stdout,
+                stderr=result.stderr,
+            )
+
+        return result.stdout.strip()
+
+    @staticmethod
+    def write_file_cmd(filename: str, content: str) -> str:
+        """
+        Build a shell command that writes content to a file, for run_script.
+
+        Args:
+            filename: Relative path within repo
+            content: File content
+
+        Returns:
+            Shell command string
+        """
+        return f"printf '%s' {shlex.quote(content)} > {shlex.quote(filename)}"
+
+    def _cat_file(self) -> subprocess.Popen:
+        """
+        Get the long-running `git cat-file --batch` process for this repository.
+
+        The process is spawned on first use and reused by all object reads,
+        so read paths cost one pipe round-trip instead of a fork/exec of git.
+        Refs are resolved per request, so commits made by other git commands
+        are visible immediately.
+        """
+        if self._cat_file_proc is None or self._cat_file_proc.poll() is not None:
+            self._cat_file_proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        return self._cat_file_proc
+
+    def _cat_object(self, object_name: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read an object through the cat-file batch process.
+
+        Args:
+            object_name: Any object name git understands (sha, ref, "<rev>:<path>")
+
+        Returns:
+            Tuple of (sha, object type, raw content), or None if the object is missing
+
+        Raises:
+            RuntimeError: If the batch process died or answered out of protocol
+        """
+        proc = self._cat_file()
+        proc.stdin.write(object_name.encode() + b"\n")
+        proc.stdin.flush()
+
+        line = proc.stdout.readline()
+        header = line.split()
+        if header and header[-1] in (b"missing", b"ambiguous"):
+            # "<name> missing" / "<name> ambiguous"; names may contain spaces
+            return None
+
+        if len(header) != 3:
+            # The stream is dead or out of step; drop the process so the
+            # next read respawns it
+            proc.kill()
+            proc.wait()
+            self._cat_file_proc = None
+            reason = f"bad header {line!r}" if line else "process exited"
+            raise RuntimeError(
+                f"git cat-file --batch in {self.repo_path} failed reading {object_name!r}: {reason}"
+            )
+
+        sha, object_type, size = header
+        content = proc.stdout.read(int(size))
+        proc.stdout.read(1)  # Trailing LF after each object
+        return sha.decode(), object_type.decode(), content
+
+    def cat(self, object_name: str) -> Optional[bytes]:
+        """
+        Get the raw content of an object, e.g. repo.cat("main:objectives.md").
+
+        Args:
+            object_name: Object name in "<rev>:<path>" or sha/ref form
+
+        Returns:
+            Raw object content, or None if the object does not exist
+        """
+        obj = self._cat_object(object_name)
+        return obj[2] if obj else None
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """
+        Resolve a ref (branch, HEAD, sha prefix) to an object hash.
+
+        Args:
+            ref: Reference to resolve
+
+        Returns:
+            Object hash, or None if the ref does not exist
+        """
+        obj = self._cat_object(ref)
+        return obj[0] if obj else None
+
+    def close(self) -> None:
+        """Stop the cat-file batch process, if one is running."""
+        proc = self._cat_file_proc
+        self._cat_file_proc = None
+        if proc is not None and proc.poll() is None:
+            proc.stdin.close()
+            proc.wait()
+            proc.stdout.close()
+
     def write_file(
         self,
         filename: str,
@@ -135,6 +345,33 @@ class GitTestRepo:
         filepath.write_text(content)
         return filepath
 
+    def write_file_if_changed(self, filename: str, content: str) -> bool:
+        """
+        Write a file to the repository unless it already has this content.
+
+        The new content is staged in a sibling temp file and moved into place
+        with os.replace, so readers never see a partial file.
+
+        Args:
+            filename: Relative path within repo
+            content: File content
+
+        Returns:
+            True if the file was written, False if it was already up to date
+            (callers can skip the commit, which would be empty)
+        """
+        filepath = self.repo_path / filename
+        try:
+            if filepath.read_text() == content:
+                return False
+        except FileNotFoundError:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        staging = filepath.with_name(f".{filepath.name}.tmp")
+        staging.write_text(content)
+        os.replace(staging, filepath)
+        return True
+
     def read_file(self, filename: str) -> str:
         """
         Read a file from the repository.
@@ -188,6 +425,66 @@ class GitTestRepo:
 
         return commit_hash
 
+    def fast_import(
+        self,
+        commits: List[FastImportCommit],
+        branch_name: Optional[str] = None,
+        start_point: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Create several commits on a branch with a single `git fast-import`.
+
+        Builds all commits in one git process instead of add + commit per
+        commit. If the branch is checked out, the working tree and index are
+        updated to the new tip afterwards.
+
+        Args:
+            commits: Commits to create, oldest first
+            branch_name: Branch to commit to (default: current branch)
+            start_point: Commit/branch to create branch_name from; the first
+                commit's parent (default: the branch's current tip)
+
+        Returns:
+            Commit hashes, in the order given
+        """
+        if branch_name is None:
+            branch_name = self.current_branch
+
+        parent = self._cat_object(start_point or branch_name)
+        committer = f"Test User <test@example.com> {int(time.time())} +0000"
+
+        stream = bytearray()
+        for mark, commit in enumerate(commits, start=1):
+            message = commit.message.encode()
+            stream += f"commit refs/heads/{branch_name}\nmark :{mark}\n".encode()
+            stream += f"committer {committer}\ndata {len(message)}\n".encode() + message + b"\n"
+            if mark == 1 and parent is not None:
+                stream += f"from {parent[0]}\n".encode()
+            for path, content in commit.files.items():
+                data = content.encode()
+                stream += f"M 100644 inline {path}\ndata {len(data)}\n".encode() + data + b"\n"
+            stream += b"\n"
+        for mark in range(1, len(commits) + 1):
+            stream += f"get-mark :{mark}\n".encode()
+
+        cmd = ["git", "-C", str(self.repo_path), "fast-import", "--quiet"]
+        result = subprocess.run(cmd, input=bytes(stream), capture_output=True, check=False)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode,
+                cmd,
+                output=result.stdout,
+                stderr=result.stderr,
+            )
+        hashes = result.stdout.decode().split()
+
+        if branch_name == self.current_branch and parent is not None and hashes:
+            # Bring index and working tree from the old tip to the new one
+            self._run_git("read-tree", "-m", "-u", parent[0], hashes[-1])
+
+        self.commits.setdefault(branch_name, []).extend(hashes)
+        return hashes
+
     def create_branch(self, branch_name: str, start_point: Optional[str] = None) -> None:
         """
         Create a new branch.
@@ -242,12 +539,25 @@ class GitTestRepo:
         if branch_name is None:
             branch_name = self.current_branch
 
-        try:
-            output = self._run_git("rev-list", "--count", branch_name)
-            return int(output)
-        except (ValueError, subprocess.CalledProcessError):
+        # Walk parents through cat-file (equivalent to `git rev-list --count`)
+        start = self._cat_object(branch_name)
+        if start is None or start[1] != "commit":
             return 0
 
+        seen = {start[0]}
+        pending = [start[2]]
+        while pending:
+            for line in pending.pop().split(b"\n"):
+                if not line:
+                    break  # End of commit headers
+                if line.startswith(b"parent "):
+                    parent = line[7:].decode()
+                    if parent not in seen:
+                        seen.add(parent)
+                        pending.append(self._cat_object(parent)[2])
+
+        return len(seen)
+
     def get_file_contents_at_commit(
         self,
         filename: str,
@@ -263,10 +573,8 @@ class GitTestRepo:
         Returns:
             File contents
         """
-        try:
-            return self._run_git("show", f"{commit}:{filename}")
-        except subprocess.CalledProcessError:
-            return ""
+        content = self.cat(f"{commit}:{filename}")
+        return content.decode() if content is not None else ""
 
     def create_conflict_scenario(
         self,
@@ -364,8 +672,35 @@ class GitTestRepo:
 
     def cleanup(self) -> None:
         """Remove the temporary repository."""
-        if self.repo_path.exists():
+        self.close()
+        try:
             shutil.rmtree(self.repo_path)
+        except FileNotFoundError:
+            pass
+
+
+class LazyTemplateRepo:
+    """
+    Template GitTestRepo that is only initialized when first copied from.
+
+    Lets suites that never touch git (go-CLI, markdown) start without it.
+    """
+
+    def __init__(self):
+        self._repo: Optional[GitTestRepo] = None
+
+    @property
+    def repo_path(self) -> Path:
+        """Path of the template repo, creating it on first access."""
+        if self._repo is None:
+            self._repo = GitTestRepo()
+        return self._repo.repo_path
+
+    def cleanup(self) -> None:
+        """Remove the template repo, if it was ever created."""
+        if self._repo is not None:
+            self._repo.cleanup()
+            self._repo = None
 
 
 class GitBranchScenario:
@@ -394,25 +729,19 @@ class GitBranchScenario:
         Returns:
             Dictionary with branch info and commit hashes
         """
-        # Create initial file on main
-        repo.write_file("README.md", "# Project")
-        main_initial = repo.commit("Initial commit")
-
-        # Add another commit on main
-        repo.write_file("README.md", "# Project\n\nUpdated")
-        main_update = repo.commit("Update README")
-
-        # Create feature branch from main
-        repo.create_branch("feature/my-feature")
+        # Main history, then the feature branch off main's tip
+        main_initial, main_update = repo.fast_import([
+            FastImportCommit("Initial commit", {"README.md": "# Project"}),
+            FastImportCommit("Update README", {"README.md": "# Project\n\nUpdated"}),
+        ])
+        feature_1, feature_2 = repo.fast_import([
+            FastImportCommit("Add feature function", {"feature.py": "def feature(): pass"}),
+            FastImportCommit(
+                "Add helper function", {"feature.py": "def feature(): pass\ndef helper(): pass"}
+            ),
+        ], "feature/my-feature", start_point="main")
         repo.checkout("feature/my-feature")
 
-        # Add feature commits
-        repo.write_file("feature.py", "def feature(): pass")
-        feature_1 = repo.commit("Add feature function")
-
-        repo.write_file("feature.py", "def feature(): pass\ndef helper(): pass")
-        feature_2 = repo.commit("Add helper function")
-
         return {
             "main": {
                 "commits": [main_initial, main_update],
@@ -439,47 +768,31 @@ class GitBranchScenario:
         Returns:
             Dictionary with branch info
         """
-        # Create initial objectives markdown on main/tracking
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\n",
-        )
-        init_commit = repo.commit("Initial objectives from TargetProcess")
-
-        # Create tracking branch
-        repo.create_branch("TP-PI-4-25-platform-eco")
-        repo.checkout("TP-PI-4-25-platform-eco")
-
-        # Add TP updates
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 5\n",
-        )
-        tp_update1 = repo.commit("TP sync: Update status")
-
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 8\n",
-        )
-        tp_update2 = repo.commit("TP sync: Update effort")
-
-        # Create feature branch from tracking
-        repo.create_branch("feature/plan-pi-4-25", "TP-PI-4-25-platform-eco")
+        # Initial objectives on main, TP syncs on the tracking branch, then
+        # user changes on a feature branch off the tracking branch
+        (init_commit,) = repo.fast_import([
+            FastImportCommit("Initial objectives from TargetProcess", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\n",
+            }),
+        ])
+        tp_update1, tp_update2 = repo.fast_import([
+            FastImportCommit("TP sync: Update status", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 5\n",
+            }),
+            FastImportCommit("TP sync: Update effort", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 8\n",
+            }),
+        ], "TP-PI-4-25-platform-eco", start_point=init_commit)
+        user_change1, user_change2 = repo.fast_import([
+            FastImportCommit("Add owner to Objective 1", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 6\nOwner: John Doe\n",
+            }),
+            FastImportCommit("Add Objective 2", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 6\nOwner: John Doe\n\n## Objective 2\nStatus: Pending\nEffort: 3\n",
+            }),
+        ], "feature/plan-pi-4-25", start_point="TP-PI-4-25-platform-eco")
         repo.checkout("feature/plan-pi-4-25")
 
-        # User makes changes on feature
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 6\nOwner: John Doe\n",
-        )
-        user_change1 = repo.commit("Add owner to Objective 1")
-
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 6\nOwner: John Doe\n\n## Objective 2\nStatus: Pending\nEffort: 3\n",
-        )
-        user_change2 = repo.commit("Add Objective 2")
-
         return {
             "tracking": {
                 "branch": "TP-PI-4-25-platform-eco",
@@ -506,31 +819,23 @@ class GitBranchScenario:
         Returns:
             Dictionary with branch info
         """
-        # Create initial file
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\n",
-        )
-        init_commit = repo.commit("Initial objectives")
-
-        # Update on main branch
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\nComment: Main branch change\n",
-        )
-        main_update = repo.commit("Update on main")
-
-        # Create feature branch from initial
-        repo.create_branch("feature/conflict-test", init_commit)
+        # Two commits on main, and a feature branch off the first one that
+        # changes the same lines
+        init_commit, main_update = repo.fast_import([
+            FastImportCommit("Initial objectives", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\n",
+            }),
+            FastImportCommit("Update on main", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: Pending\nEffort: 5\nComment: Main branch change\n",
+            }),
+        ])
+        (feature_update,) = repo.fast_import([
+            FastImportCommit("Update on feature", {
+                "objectives.md": "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 8\nComment: Feature branch change\n",
+            }),
+        ], "feature/conflict-test", start_point=init_commit)
         repo.checkout("feature/conflict-test")
 
-        # Conflicting update on feature
-        repo.write_file(
-            "objectives.md",
-            "# Team Objectives\n\n## Objective 1\nStatus: In Progress\nEffort: 8\nComment: Feature branch change\n",
-        )
-        feature_update = repo.commit("Update on feature")
-
         return {
             "main": {
                 "branch": "main",
@@ -548,18 +853,26 @@ class GitBranchScenario:
 import pytest
 
 
+@pytest.fixture(scope="session")
+def git_repo_template() -> GitTestRepo:
+    """Session-wide freshly initialized repo that per-test repos are copied from."""
+    repo = GitTestRepo()
+    yield repo
+    repo.cleanup()
+
+
 @pytest.fixture
-def git_repo() -> GitTestRepo:
+def git_repo(git_repo_template: GitTestRepo) -> GitTestRepo:
     """Fixture providing a temporary git repository."""
-    repo = GitTestRepo()
+    repo = GitTestRepo(template=git_repo_template.repo_path)
     yield repo
     repo.cleanup()
 
 
 @pytest.fixture
-def git_repo_with_branches() -> GitTestRepo:
+def git_repo_with_branches(git_repo_template: GitTestRepo) -> GitTestRepo:
     """Fixture providing a git repo with main + feature branches."""
-    repo = GitTestRepo()
+    repo = GitTestRepo(template=git_repo_template.repo_path)
     GitBranchScenario.setup_simple_workflow(repo)
     repo.checkout("main")
     yield repo
@@ -567,9 +880,9 @@ def git_repo_with_branches() -> GitTestRepo:
 
 
 @pytest.fixture
-def git_repo_tracking_scenario() -> GitTestRepo:
+def git_repo_tracking_scenario(git_repo_template: GitTestRepo) -> GitTestRepo:
     """Fixture providing a git repo with tracking + feature branches."""
-    repo = GitTestRepo()
+    repo = GitTestRepo(template=git_repo_template.repo_path)
     GitBranchScenario.setup_tracking_branch_scenario(repo)
     repo.checkout("feature/plan-pi-4-25")
     yield repo
@@ -577,9 +890,9 @@ def git_repo_tracking_scenario() -> GitTestRepo:
 
 
 @pytest.fixture
-def git_repo_conflict_scenario() -> GitTestRepo:
+def git_repo_conflict_scenario(git_repo_template: GitTestRepo) -> GitTestRepo:
     """Fixture providing a git repo with a merge conflict."""
-    repo = GitTestRepo()
+    repo = GitTestRepo(template=git_repo_template.repo_path)
     GitBranchScenario.setup_conflict_scenario(repo)
     yield repo
     repo.cleanup()
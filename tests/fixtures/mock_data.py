@@ -19,9 +19,9 @@ from tests.fixtures.builders import (
     TPTeamBuilder,
     TPTeamObjectiveBuilder,
     JiraStoryBuilder,
-    create_tech_debt_feature,
-    create_platform_eco_team,
-    create_platform_governance_objective,
+    fresh_tech_debt_feature,
+    fresh_platform_eco_team,
+    fresh_platform_governance_objective,
 )
 
 
@@ -33,26 +33,26 @@ from tests.fixtures.builders import (
 @pytest.fixture
 def tp_tech_debt_feature():
     """Fixture: Realistic tech debt feature (based on #1937700)."""
-    return create_tech_debt_feature()
+    return fresh_tech_debt_feature()
 
 
 @pytest.fixture
 def tp_platform_team():
     """Fixture: Realistic platform team."""
-    return create_platform_eco_team()
+    return fresh_platform_eco_team()
 
 
 @pytest.fixture
 def tp_platform_objective():
     """Fixture: Realistic team objective."""
-    return create_platform_governance_objective()
+    return fresh_platform_governance_objective()
 
 
 @pytest.fixture
 def tp_multiple_teams():
     """Fixture: Multiple teams with different ARTs."""
     return [
-        create_platform_eco_team(),
+        fresh_platform_eco_team(),
         (TPTeamBuilder()
          .with_id(2022904)
          .with_name("Data Analytics")
@@ -72,7 +72,7 @@ def tp_multiple_teams():
 def tp_multiple_objectives():
     """Fixture: Multiple team objectives."""
     return [
-        create_platform_governance_objective(),
+        fresh_platform_governance_objective(),
         (TPTeamObjectiveBuilder()
          .with_id(2019100)
          .with_name("API performance optimization")
@@ -96,7 +96,7 @@ def tp_multiple_objectives():
 def tp_multiple_features():
     """Fixture: Multiple features in different states."""
     return [
-        create_tech_debt_feature(),
+        fresh_tech_debt_feature(),
         (TPFeatureBuilder()
          .with_id(1937701)
          .with_name("Implement distributed tracing")
@@ -0,0 +1,206 @@
+"""
+Loopback mock of the TargetProcess API for performance step definitions.
+
+Serves canned JSON resources over HTTP/1.1 (keep-alive) on 127.0.0.1,
+optionally delaying each response to stand in for network latency, and
+records every request and accepted connection so steps can assert on what
+actually went over the wire. Responses carry an ETag (a hash of the body);
+a request whose If-None-Match matches gets an empty 304. POSTed operations
+are echoed back, one per request or many per request to /batch. With
+compress set, GET bodies are gzip-encoded for clients that accept it.
+Queued error statuses are returned to the next GET requests, in order, to
+simulate transient failures. A ?since=<timestamp> query keeps only list
+items whose updated_at is later, for delta syncs, and ?fields=a,b returns
+only those fields (sparse fieldsets).
+
+Usage:
+    from tests.fixtures.mock_tp_server import MockTPServer
+
+    server = MockTPServer(delay=0.1).start()
+    teams = requests.get(server.url("/teams")).json()
+    server.stop()
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+DEFAULT_RESOURCES: Dict[str, Any] = {
+    "/teams": [
+        {"id": 1, "name": "Team1"},
+        {"id": 2, "name": "Team2"},
+        {"id": 3, "name": "Team3"},
+    ],
+    "/releases": [
+        {"id": 1, "name": "PI-4/25"},
+        {"id": 2, "name": "PI-5/25"},
+    ],
+    "/objectives": [{"id": i, "name": f"Objective {i}"} for i in range(1, 10)],
+    "/teams/1": {
+        "id": 1,
+        "name": "Team1",
+        "description": "Platform engineering team owning shared infrastructure.",
+        "owner": {"id": 10, "name": "Alice Owner", "email": "alice@example.com"},
+        "art": {"id": 100, "name": "Data, Analytics and Digital"},
+        "releases": [{"id": 1, "name": "PI-4/25"}, {"id": 2, "name": "PI-5/25"}],
+    },
+    "/teams/1/members": [
+        {"id": 10, "name": "Alice Owner", "role": "Product Owner"},
+        {"id": 11, "name": "Bob Engineer", "role": "Developer"},
+    ],
+}
+
+
+def _project(resource: Any, fields: List[str]) -> Any:
+    """Keep only fields of a dict resource, or of each item of a list resource."""
+    if isinstance(resource, list):
+        return [_project(item, fields) for item in resource]
+    return {name: resource[name] for name in fields if name in resource}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves MockTPServer resources; one instance per connection."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without TCP_NODELAY a kept-alive
+    # connection stalls on delayed ACKs for every response
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.mock._count_connection()  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        mock: MockTPServer = self.server.mock  # type: ignore[attr-defined]
+        mock._record(self)
+        if mock.delay:
+            time.sleep(mock.delay)
+
+        error_status = mock._next_error()
+        if error_status is not None:
+            self._send(error_status, b"")
+            return
+
+        path, _, query = self.path.partition("?")
+        if path not in mock.resources:
+            self._send(404, b"")
+            return
+        resource = mock.resources[path]
+        params = parse_qs(query)
+        since = params.get("since")
+        if since:
+            resource = [item for item in resource if item.get("updated_at", 0) > float(since[0])]
+        fields = params.get("fields")
+        if fields:
+            resource = _project(resource, fields[0].split(","))
+        body = json.dumps(resource).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+            return
+        if mock.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            self._send(200, gzip.compress(body), etag, content_encoding="gzip")
+            return
+        self._send(200, body, etag)
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        mock: MockTPServer = self.server.mock  # type: ignore[attr-defined]
+        mock._record(self)
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if mock.delay:
+            time.sleep(mock.delay)
+
+        if self.path == "/batch":
+            # {"ops": [op, ...]} -> {"results": [op, ...]}, one round trip
+            result = {"results": [dict(op, ok=True) for op in payload.get("ops", [])]}
+        else:
+            result = dict(payload, ok=True)
+        self._send(200, json.dumps(result).encode())
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        etag: Optional[str] = None,
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        if content_encoding is not None:
+            self.send_header("Content-Encoding", content_encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Keep test output quiet."""
+
+
+class MockTPServer:
+    """
+    Threaded loopback HTTP server with canned TargetProcess resources.
+
+    Attributes:
+        delay: Seconds each response is held back (simulated API latency)
+        compress: Whether GET responses are gzip-encoded when the client accepts it
+        resources: Path -> JSON-serializable body
+        requests: One (method, path) tuple per request received
+        errors: Statuses (e.g. 503) returned, in order, to the next GET requests
+        connection_count: TCP connections accepted so far
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        resources: Optional[Dict[str, Any]] = None,
+        compress: bool = False,
+    ):
+        self.delay = delay
+        self.compress = compress
+        self.resources = dict(DEFAULT_RESOURCES if resources is None else resources)
+        self.requests: List[tuple] = []
+        self.errors: List[int] = []
+        self.connection_count = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    def url(self, path: str) -> str:
+        """Absolute URL for a path on this server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def start(self) -> "MockTPServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self.connection_count += 1
+
+    def _next_error(self) -> Optional[int]:
+        with self._lock:
+            return self.errors.pop(0) if self.errors else None
+
+    def _record(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests.append((handler.command, handler.path))
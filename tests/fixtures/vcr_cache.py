@@ -0,0 +1,61 @@
+"""
+In-memory cassette cache for VCR.
+
+Reads every cassette under the cassette library once, in parallel, and serves
+later cassette loads from memory instead of re-reading the file per test.
+
+Usage:
+    from tests.fixtures.vcr_cache import CachedFilesystemPersister, prefetch_cassettes
+
+    prefetch_cassettes("tests/fixtures/python")
+    my_vcr.register_persister(CachedFilesystemPersister)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+from vcr.persisters.filesystem import FilesystemPersister
+from vcr.serialize import deserialize
+
+# Resolved cassette path -> cassette text
+CASSETTE_CACHE: Dict[str, str] = {}
+
+
+def _cache_key(cassette_path) -> str:
+    return str(Path(cassette_path).resolve())
+
+
+def prefetch_cassettes(cassette_dir: str, max_workers: int = 8) -> int:
+    """
+    Read all .yaml cassettes under cassette_dir into CASSETTE_CACHE.
+
+    Args:
+        cassette_dir: Cassette library directory
+        max_workers: Number of reader threads
+
+    Returns:
+        Number of cassettes cached
+    """
+    paths = list(Path(cassette_dir).rglob("*.yaml"))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for path, text in zip(paths, pool.map(Path.read_text, paths)):
+            CASSETTE_CACHE[_cache_key(path)] = text
+    return len(paths)
+
+
+class CachedFilesystemPersister(FilesystemPersister):
+    """Filesystem persister that serves cassettes from CASSETTE_CACHE first."""
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        text = CASSETTE_CACHE.get(_cache_key(cassette_path))
+        if text is None:
+            return super().load_cassette(cassette_path, serializer)
+        return deserialize(text, serializer)
+
+    @staticmethod
+    def save_cassette(cassette_path, cassette_dict, serializer):
+        FilesystemPersister.save_cassette(cassette_path, cassette_dict, serializer)
+        # Re-recorded cassettes are read back from disk next time
+        CASSETTE_CACHE.pop(_cache_key(cassette_path), None)
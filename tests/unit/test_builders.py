@@ -0,0 +1,67 @@
+"""
+Tests for the template-backed TP fixture builders.
+"""
+
+import pytest
+
+from tests.fixtures.builders import (
+    TPFeatureBuilder,
+    TPTeamBuilder,
+    TPTeamObjectiveBuilder,
+    create_tech_debt_feature,
+    fresh_tech_debt_feature,
+)
+
+
+@pytest.mark.parametrize("builder_class", [TPTeamBuilder, TPFeatureBuilder, TPTeamObjectiveBuilder])
+def test_default_build_matches_full_response(builder_class):
+    """A template build equals a from-scratch build, key order included."""
+    builder = builder_class()
+    built = builder.build()
+    full = builder._full_response()
+
+    assert list(built) == list(full)
+    dates = {"CreateDate", "CreatedDate", "ModifyDate"}
+    assert {k: v for k, v in built.items() if k not in dates} == \
+        {k: v for k, v in full.items() if k not in dates}
+
+
+def test_setters_rebuild_only_their_nested_objects():
+    """Changed groups are fresh dicts; unchanged ones are shared with the template."""
+    feature = TPFeatureBuilder().with_team(5, "Team Five").with_jira_priority("High").build()
+
+    assert feature["Team"] == {"Id": 5, "Name": "Team Five", "ResourceType": "Team"}
+    assert feature["CustomFields"][2]["Value"] == "High"
+    assert feature["Team"] is not TPFeatureBuilder._TEMPLATE["Team"]
+    assert feature["Owner"] is TPFeatureBuilder._TEMPLATE["Owner"]
+
+
+def test_scalar_setters_do_not_leak_between_builds():
+    """Top-level fields are per build even though the template is shared."""
+    first = TPTeamBuilder().with_name("Platform Eco").with_active(False).build()
+    second = TPTeamBuilder().build()
+
+    assert (first["Name"], first["Abbreviation"], first["IsActive"]) == ("Platform Eco", "PE", False)
+    assert (second["Name"], second["IsActive"]) == ("Cloud Enablement & Delivery", True)
+
+
+def test_create_helpers_are_cached_and_fresh_helpers_copy():
+    """create_* returns one shared dict; fresh_* returns independent deep copies."""
+    assert create_tech_debt_feature() is create_tech_debt_feature()
+
+    feature = fresh_tech_debt_feature()
+    feature["Team"]["Name"] = "Changed"
+    assert feature == {**create_tech_debt_feature(), "Team": feature["Team"]}
+    assert create_tech_debt_feature()["Team"]["Name"] == "Cloud Enablement & Delivery"
+
+
+def test_entity_references_are_shared_per_distinct_value():
+    """Responses naming the same team share one reference dict."""
+    first = TPFeatureBuilder().with_id(1).with_team(7, "Seven").build()
+    second = TPTeamObjectiveBuilder().with_team(7, "Seven").build()
+    other = TPFeatureBuilder().with_team(8, "Eight").build()
+
+    assert first["Team"] is second["Team"]
+    assert first["Team"] is not other["Team"]
+    assert first["Owner"] is first["Creator"]
+    assert first["Owner"] == {"Id": 319, "FullName": "Stéphane Dattenny", "ResourceType": "GeneralUser"}
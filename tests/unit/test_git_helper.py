@@ -0,0 +1,202 @@
+"""
+Tests for the GitTestRepo fixture helper.
+
+Validates that the helper's read paths agree with the git CLI.
+"""
+
+import subprocess
+
+import pytest
+
+from tests.fixtures.git_helper import (
+    FastImportCommit,
+    GitTestRepo,
+    LazyTemplateRepo,
+    plan_branch_names,
+    plan_slugs,
+)
+
+
+class TestCatFileReads:
+    """Test object reads served by the cat-file batch process."""
+
+    def test_file_contents_at_commit(self, git_repo):
+        """Contents are read from the requested commit, not the working tree."""
+        git_repo.write_file("objectives.md", "# Objectives\n\nEffort: 5\n")
+        first = git_repo.commit("Add objectives")
+        git_repo.write_file("objectives.md", "# Objectives\n\nEffort: 8\n")
+        git_repo.commit("Update effort")
+
+        assert git_repo.get_file_contents_at_commit("objectives.md", first) == (
+            "# Objectives\n\nEffort: 5\n"
+        )
+        assert "Effort: 8" in git_repo.get_file_contents_at_commit("objectives.md")
+
+    def test_missing_object_returns_empty(self, git_repo):
+        """Missing paths and refs do not raise."""
+        assert git_repo.get_file_contents_at_commit("nope.md") == ""
+        assert git_repo.cat("no-such-branch") is None
+        assert git_repo.get_commit_count("no-such-branch") == 0
+        assert git_repo.get_file_contents_at_commit("x y.md") == ""
+        assert git_repo.get_commit_count("a b") == 0
+
+    def test_commit_count_matches_rev_list(self, git_repo_tracking_scenario):
+        """Parent walk counts the same commits as git rev-list --count."""
+        repo = git_repo_tracking_scenario
+        for branch in ("main", "TP-PI-4-25-platform-eco", "feature/plan-pi-4-25"):
+            expected = int(repo._run_git("rev-list", "--count", branch))
+            assert repo.get_commit_count(branch) == expected
+
+    def test_reads_see_new_commits(self, git_repo):
+        """The batch process sees commits made after it was started."""
+        before = git_repo.get_commit_count()
+        git_repo.write_file("a.md", "a")
+        git_repo.commit("Add a")
+        assert git_repo.get_commit_count() == before + 1
+
+    def test_cleanup_stops_batch_process(self):
+        """cleanup() terminates the cat-file process."""
+        repo = GitTestRepo()
+        repo.get_commit_count()
+        proc = repo._cat_file_proc
+        repo.cleanup()
+        assert proc.poll() is not None
+        assert repo._cat_file_proc is None
+
+    def test_dead_batch_process_raises_and_respawns(self, git_repo):
+        """A batch process that exits mid-read raises, and the next read respawns it."""
+        # Stand-in that consumes the request and exits without answering
+        git_repo._cat_file_proc = subprocess.Popen(
+            ["sh", "-c", "read line"], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        with pytest.raises(RuntimeError, match="process exited"):
+            git_repo.cat("HEAD")
+
+        assert git_repo._cat_file_proc is None
+        assert git_repo.cat("HEAD") is not None
+
+
+class TestRunScript:
+    """Test chained shell scripts run in the repository."""
+
+    def test_script_runs_commands_in_order(self, git_repo):
+        """Commands run in one shell, in the repository directory."""
+        out = git_repo.run_script([
+            "git checkout -q -b TP-test",
+            git_repo.write_file_cmd("plan.md", "# It's a plan\n"),
+            "git add plan.md",
+            "git commit -q -m 'Add plan'",
+            "git rev-parse --abbrev-ref HEAD",
+        ])
+
+        assert out == "TP-test"
+        assert git_repo.get_file_contents_at_commit("plan.md", "TP-test") == "# It's a plan\n"
+
+    def test_script_stops_at_first_failure(self, git_repo):
+        """A failing command raises and skips the rest of the script."""
+        with pytest.raises(subprocess.CalledProcessError):
+            git_repo.run_script(["git checkout -q no-such-branch", "touch marker"])
+
+        assert not (git_repo.repo_path / "marker").exists()
+
+
+class TestTemplateCopy:
+    """Test repos copied from the session template."""
+
+    def test_copy_is_independent_of_template(self, git_repo, git_repo_template):
+        """Commits in a copy do not touch the template."""
+        template_count = git_repo_template.get_commit_count()
+
+        git_repo.write_file("a.md", "a")
+        git_repo.commit("Add a")
+
+        assert git_repo.repo_path != git_repo_template.repo_path
+        assert git_repo.get_commit_count() == template_count + 1
+        assert git_repo_template.get_commit_count() == template_count
+        assert git_repo.get_status() == ""
+
+    def test_lazy_template_is_built_on_first_use(self):
+        """No repo exists until repo_path is read; cleanup removes it."""
+        template = LazyTemplateRepo()
+        template.cleanup()  # Nothing to remove yet
+
+        path = template.repo_path
+        assert path.is_dir()
+        assert template.repo_path == path
+        copy = GitTestRepo(template=path)
+        assert copy.get_commit_count() == 1
+        copy.cleanup()
+
+        template.cleanup()
+        assert not path.exists()
+
+
+class TestFastImport:
+    """Test bulk commit creation with git fast-import."""
+
+    def test_commits_created_and_checked_out(self, git_repo):
+        """All commits land on the current branch and the working tree follows."""
+        before = git_repo.get_commit_count()
+
+        hashes = git_repo.fast_import([
+            FastImportCommit(f"Change {i}", {f"change-{i}.md": f"# Change {i}\n"})
+            for i in range(3)
+        ])
+
+        assert len(hashes) == 3
+        assert git_repo.get_commit_count() == before + 3
+        assert git_repo.get_log(max_count=1) == [f"{hashes[-1][:7]} Change 2"]
+        assert git_repo.read_file("change-2.md") == "# Change 2\n"
+        assert git_repo.get_status() == ""
+        assert git_repo.get_commits_on_branch("main") == hashes
+
+    def test_other_branch_leaves_working_tree(self, git_repo):
+        """Importing to another branch does not touch the checkout."""
+        git_repo.create_branch("feature/x")
+        git_repo.fast_import([FastImportCommit("Add x", {"x.md": "x"})], "feature/x")
+
+        assert git_repo.get_file_contents_at_commit("x.md", "feature/x") == "x"
+        assert not (git_repo.repo_path / "x.md").exists()
+        assert git_repo.get_status() == ""
+
+
+class TestWriteFileIfChanged:
+    """Test content-aware file writes."""
+
+    def test_unchanged_content_is_not_rewritten(self, git_repo):
+        """Same content returns False and leaves the file untouched."""
+        assert git_repo.write_file_if_changed("docs/plan.md", "# Plan\n") is True
+        mtime = (git_repo.repo_path / "docs/plan.md").stat().st_mtime_ns
+
+        assert git_repo.write_file_if_changed("docs/plan.md", "# Plan\n") is False
+        assert (git_repo.repo_path / "docs/plan.md").stat().st_mtime_ns == mtime
+
+    def test_changed_content_replaces_file(self, git_repo):
+        """New content replaces the file without leaving a staging file behind."""
+        git_repo.write_file("plan.md", "old")
+
+        assert git_repo.write_file_if_changed("plan.md", "new") is True
+        assert git_repo.read_file("plan.md") == "new"
+        assert sorted(p.name for p in git_repo.repo_path.iterdir() if p.name != ".git") == [
+            ".gitkeep",
+            "plan.md",
+        ]
+
+
+class TestPlanBranchNames:
+    """Test plan-sync branch and file naming."""
+
+    def test_names_match_plan_sync_convention(self):
+        """Names match what GitPlanSync generates for the same team/release."""
+        from tpcli_pi.core.git_integration import GitPlanSync
+
+        sync = GitPlanSync.__new__(GitPlanSync)
+        tracking, feature, filename = plan_branch_names("Platform Eco", "PI-4/25")
+
+        assert tracking == sync._generate_tracking_branch_name("PI-4/25", "Platform Eco")
+        assert feature == sync._generate_feature_branch_name("PI-4/25")
+        assert filename == "pi-4-25-platform-eco.md"
+
+    def test_slugs_map_slashes_and_spaces(self):
+        """Slugs are lowercase with "/" and " " turned into "-"."""
+        assert plan_slugs("Platform Eco", "PI-4/25") == ("platform-eco", "pi-4-25")
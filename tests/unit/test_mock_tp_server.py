@@ -0,0 +1,107 @@
+"""
+Tests for the loopback TargetProcess API mock used by performance steps.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.fixtures.mock_tp_server import DEFAULT_RESOURCES, MockTPServer
+
+
+@pytest.fixture
+def tp_server():
+    server = MockTPServer().start()
+    yield server
+    server.stop()
+
+
+class TestMockTPServer:
+    """Test canned responses and request recording."""
+
+    def test_serves_resources_and_records_requests(self, tp_server):
+        """Known paths return their JSON body; every request is recorded."""
+        assert requests.get(tp_server.url("/teams"), timeout=5).json() == DEFAULT_RESOURCES["/teams"]
+        assert requests.get(tp_server.url("/nope"), timeout=5).status_code == 404
+        assert tp_server.requests == [("GET", "/teams"), ("GET", "/nope")]
+
+    def test_delayed_requests_are_served_concurrently(self, tp_server):
+        """Delays overlap across connections instead of adding up."""
+        tp_server.delay = 0.2
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda p: requests.get(tp_server.url(p), timeout=5), ["/teams"] * 3))
+        assert time.perf_counter() - start < 0.6
+
+    def test_connection_count_pooled_vs_unpooled(self, tp_server):
+        """A pooled session opens one connection; fresh sessions open one per call."""
+        url = tp_server.url("/teams")
+        for _ in range(5):
+            with requests.Session() as session:
+                session.get(url, timeout=5)
+        assert tp_server.connection_count == 5
+
+        with requests.Session() as session:
+            for _ in range(5):
+                session.get(url, timeout=5)
+        assert tp_server.connection_count == 6
+
+    def test_matching_etag_gets_empty_not_modified(self, tp_server):
+        """If-None-Match with the current ETag returns 304 and no body."""
+        url = tp_server.url("/teams")
+        etag = requests.get(url, timeout=5).headers["ETag"]
+
+        cached = requests.get(url, headers={"If-None-Match": etag}, timeout=5)
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        tp_server.resources["/teams"] = [{"id": 4, "name": "Team4"}]
+        changed = requests.get(url, headers={"If-None-Match": etag}, timeout=5)
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_batch_post_applies_all_ops_in_one_request(self, tp_server):
+        """/batch echoes every op; a plain POST echoes its single op."""
+        ops = [{"id": i, "effort": i} for i in range(3)]
+        batch = requests.post(tp_server.url("/batch"), json={"ops": ops}, timeout=5).json()
+        single = requests.post(tp_server.url("/objectives"), json=ops[0], timeout=5).json()
+
+        assert batch["results"] == [dict(op, ok=True) for op in ops]
+        assert single == dict(ops[0], ok=True)
+        assert tp_server.requests == [("POST", "/batch"), ("POST", "/objectives")]
+
+
+    def test_compress_gzip_encodes_for_accepting_clients(self, tp_server):
+        """Bodies are gzip-encoded only when enabled and accepted."""
+        url = tp_server.url("/objectives")
+        assert "Content-Encoding" not in requests.get(url, timeout=5).headers
+
+        tp_server.compress = True
+        resp = requests.get(url, timeout=5)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.json() == DEFAULT_RESOURCES["/objectives"]
+
+        plain = requests.get(url, headers={"Accept-Encoding": "identity"}, timeout=5)
+        assert "Content-Encoding" not in plain.headers
+
+    def test_queued_errors_precede_normal_responses(self, tp_server):
+        """Each queued status answers one GET, then resources are served again."""
+        tp_server.errors = [503, 502]
+        url = tp_server.url("/teams")
+        statuses = [requests.get(url, timeout=5).status_code for _ in range(3)]
+        assert statuses == [503, 502, 200]
+
+    def test_since_keeps_only_later_updates(self, tp_server):
+        """?since= filters list items on updated_at."""
+        tp_server.resources["/objectives"] = [{"id": i, "updated_at": float(i)} for i in range(5)]
+        resp = requests.get(tp_server.url("/objectives"), params={"since": 2.5}, timeout=5)
+        assert [o["id"] for o in resp.json()] == [3, 4]
+
+    def test_fields_returns_sparse_fieldset(self, tp_server):
+        """?fields= projects dict resources and each item of list resources."""
+        team = requests.get(tp_server.url("/teams/1"), params={"fields": "id,name"}, timeout=5)
+        assert team.json() == {"id": 1, "name": "Team1"}
+        teams = requests.get(tp_server.url("/teams"), params={"fields": "id"}, timeout=5)
+        assert teams.json() == [{"id": 1}, {"id": 2}, {"id": 3}]
@@ -5,6 +5,9 @@ from unittest.mock import Mock
 
 from tpcli_pi.core.resilience import (
     APIRateLimitHandler,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
     NetworkError,
     PartialFailureHandler,
     RateLimitError,
@@ -80,6 +83,15 @@ class TestRetryableOperation:
         assert op.attempts == 1
         assert fn.call_count == 2
 
+    def test_backoff_goes_through_injected_sleep(self):
+        """Test each backoff delay is handed to the sleep callable."""
+        fn = Mock(side_effect=[RecoverableError("a"), RecoverableError("b"), "success"])
+        delays = []
+        op = RetryableOperation("test", fn, RetryConfig(base_delay=0.5), sleep=delays.append)
+
+        assert op.execute() == "success"
+        assert delays == [0.5, 1.0]
+
     def test_operation_fails_non_recoverable(self):
         """Test that non-recoverable errors are not retried."""
         fn = Mock(side_effect=ValueError("Permanent failure"))
@@ -129,6 +141,65 @@ class TestRetryableOperation:
         assert op.attempts == 2
 
 
+class TestCircuitBreaker:
+    """Tests for the circuit breaker."""
+
+    def _breaker(self):
+        self.now = 0.0
+        return CircuitBreaker("fetch", fail_max=3, reset_timeout=30.0, clock=lambda: self.now)
+
+    def test_opens_after_fail_max_and_fails_fast(self):
+        """Test circuit opens at fail_max and stops calling the operation."""
+        breaker = self._breaker()
+        failing = Mock(side_effect=NetworkError("refused"))
+
+        for _ in range(3):
+            with pytest.raises(NetworkError):
+                breaker.call(failing)
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call(failing)
+        assert failing.call_count == 3
+
+    def test_success_resets_failure_count(self):
+        """Test a success in between keeps the circuit closed."""
+        breaker = self._breaker()
+        for _ in range(2):
+            with pytest.raises(NetworkError):
+                breaker.call(Mock(side_effect=NetworkError("refused")))
+        breaker.call(Mock(return_value="ok"))
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failure_count == 0
+
+    def test_trial_call_after_reset_timeout(self):
+        """Test a successful trial closes the circuit, a failed one reopens it."""
+        breaker = self._breaker()
+        for _ in range(3):
+            with pytest.raises(NetworkError):
+                breaker.call(Mock(side_effect=NetworkError("refused")))
+
+        self.now = 30.0
+        with pytest.raises(NetworkError):
+            breaker.call(Mock(side_effect=NetworkError("refused")))
+        assert breaker.state == CircuitState.OPEN
+
+        self.now = 60.0
+        assert breaker.call(Mock(return_value="ok")) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_non_recoverable_errors_do_not_open(self):
+        """Test errors that retrying cannot fix pass through uncounted."""
+        breaker = self._breaker()
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                breaker.call(Mock(side_effect=ValueError("bad request")))
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failure_count == 0
+
+
 class TestRecoverableErrors:
     """Tests for error types."""
 
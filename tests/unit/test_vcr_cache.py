@@ -0,0 +1,76 @@
+"""
+Tests for the in-memory VCR cassette cache.
+"""
+
+import pytest
+import requests
+import vcr
+from vcr.serializers import yamlserializer
+
+from tests.fixtures.mock_tp_server import MockTPServer
+from tests.fixtures.vcr_cache import (
+    CASSETTE_CACHE,
+    CachedFilesystemPersister,
+    _cache_key,
+    prefetch_cassettes,
+)
+
+
+@pytest.fixture
+def cached_vcr(tmp_path):
+    recorder = vcr.VCR(cassette_library_dir=str(tmp_path), record_mode="once")
+    recorder.register_persister(CachedFilesystemPersister)
+    CASSETTE_CACHE.clear()
+    yield recorder
+    CASSETTE_CACHE.clear()
+
+
+@pytest.fixture
+def tp_server():
+    server = MockTPServer().start()
+    yield server
+    server.stop()
+
+
+class TestCachedFilesystemPersister:
+    """Test record, prefetch and replay through the cache."""
+
+    def test_prefetch_reads_every_cassette(self, tmp_path):
+        """All .yaml files below the directory are cached by resolved path."""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "a.yaml").write_text("a")
+        (tmp_path / "nested" / "b.yaml").write_text("b")
+        (tmp_path / "ignored.json").write_text("{}")
+        CASSETTE_CACHE.clear()
+
+        assert prefetch_cassettes(str(tmp_path)) == 2
+        assert CASSETTE_CACHE[_cache_key(tmp_path / "a.yaml")] == "a"
+        assert CASSETTE_CACHE[_cache_key(tmp_path / "nested" / "b.yaml")] == "b"
+        CASSETTE_CACHE.clear()
+
+    def test_record_then_replay_from_cache(self, cached_vcr, tmp_path, tp_server):
+        """A prefetched cassette replays even after the file is gone."""
+        url = tp_server.url("/teams")
+        with cached_vcr.use_cassette("teams.yaml"):
+            recorded = requests.get(url, timeout=5).json()
+        cassette_file = tmp_path / "teams.yaml"
+        assert cassette_file.exists()
+
+        assert prefetch_cassettes(str(tmp_path)) == 1
+        cassette_file.unlink()
+        with cached_vcr.use_cassette("teams.yaml") as cassette:
+            assert requests.get(url, timeout=5).json() == recorded
+            assert cassette.play_count == 1
+        assert len(tp_server.requests) == 1
+
+    def test_save_drops_cached_entry(self, cached_vcr, tmp_path):
+        """Re-recording a cassette evicts its stale cached text."""
+        cassette_file = tmp_path / "teams.yaml"
+        CASSETTE_CACHE[_cache_key(cassette_file)] = "stale"
+
+        CachedFilesystemPersister.save_cassette(
+            str(cassette_file), {"requests": [], "responses": []}, yamlserializer
+        )
+
+        assert _cache_key(cassette_file) not in CASSETTE_CACHE
+        assert cassette_file.exists()
@@ -2,6 +2,7 @@
 
 Provides:
 - Retry logic with exponential backoff
+- Circuit breaker for failing fast during outages
 - Partial failure handling
 - API rate limit handling
 - Graceful degradation
@@ -59,6 +60,28 @@ class NetworkError(TemporaryError):
     pass
 
 
+class CircuitOpenError(Exception):
+    """Raised instead of calling an operation while its circuit is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        """Initialize circuit open error.
+
+        Args:
+            name: Name of the protected operation
+            retry_in: Seconds until the circuit lets a trial call through
+        """
+        self.retry_in = retry_in
+        super().__init__(f"Circuit for {name} is open, retry in {retry_in:.1f}s")
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls go through
+    OPEN = "open"  # Calls fail fast
+    HALF_OPEN = "half_open"  # One trial call decides
+
+
 class RetryConfig:
     """Configuration for retry logic."""
 
@@ -113,6 +136,7 @@ class RetryableOperation:
         operation_fn: Callable[[], T],
         config: Optional[RetryConfig] = None,
         is_recoverable: Optional[Callable[[Exception], bool]] = None,
+        sleep: Callable[[float], None] = time.sleep,
     ):
         """Initialize retryable operation.
 
@@ -121,11 +145,13 @@ class RetryableOperation:
             operation_fn: Function to execute
             config: Retry configuration (default: standard config)
             is_recoverable: Function to determine if exception is recoverable
+            sleep: Called with each backoff delay in seconds
         """
         self.operation_name = operation_name
         self.operation_fn = operation_fn
         self.config = config or RetryConfig()
         self.is_recoverable = is_recoverable or self._default_is_recoverable
+        self.sleep = sleep
         self.attempts = 0
         self.last_error: Optional[Exception] = None
 
@@ -191,11 +217,85 @@ class RetryableOperation:
                 except Exception:
                     pass  # Monitoring failure shouldn't block retry
 
-                time.sleep(delay)
+                self.sleep(delay)
 
         raise self.last_error
 
 
+class CircuitBreaker:
+    """Stops calling a failing operation until it has had time to recover."""
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        is_recoverable: Optional[Callable[[Exception], bool]] = None,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Name of the protected operation (for logging)
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+            clock: Monotonic time source
+            is_recoverable: Function to determine if exception counts as a failure
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.is_recoverable = is_recoverable or RetryableOperation._default_is_recoverable
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def call(self, operation_fn: Callable[[], T]) -> T:
+        """Call operation_fn unless the circuit is open.
+
+        Args:
+            operation_fn: Function to execute
+
+        Returns:
+            Result of operation
+
+        Raises:
+            CircuitOpenError: If the circuit is open (operation not called)
+            Exception: Whatever operation_fn raised; only recoverable errors
+                count towards opening the circuit
+        """
+        if self.state == CircuitState.OPEN:
+            elapsed = self.clock() - self.opened_at
+            if elapsed < self.reset_timeout:
+                raise CircuitOpenError(self.name, self.reset_timeout - elapsed)
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"Circuit for {self.name} half-open, trying one call")
+
+        try:
+            result = operation_fn()
+        except Exception as e:
+            if self.is_recoverable(e):
+                self._record_failure()
+            raise
+
+        if self.state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        return result
+
+    def _record_failure(self) -> None:
+        """Count a failure, opening the circuit at fail_max or on a failed trial."""
+        self.failure_count += 1
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.fail_max:
+            self.state = CircuitState.OPEN
+            self.opened_at = self.clock()
+            logger.warning(
+                f"Circuit for {self.name} opened after {self.failure_count} failures"
+            )
+
+
 class PartialFailureHandler:
     """Handles partial failures across multiple operations."""
 